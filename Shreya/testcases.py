@@ -1,6 +1,13 @@
 import os
 import random
 
+from tools.seeding import seed_file
+
+# --- SETTINGS ---
+NUM_FILES = 100
+MASTER_SEED = 0
+MAX_VAL = 10**18
+
 def solve(n):
     """
     CORRECT O(1) Logic:
@@ -14,6 +21,35 @@ def solve(n):
     else:
         return "Shreya"
 
+def build_n(i):
+    """Returns the single n of file index i."""
+    n = 0
+    if i == 0: n = 1 
+    elif i == 1: n = 6
+    elif i == 2: n = 3
+    elif i == 3: n = 98
+    elif i == 4: n = 2
+    elif i == 5: n = MAX_VAL
+    elif i == 6: n = MAX_VAL - 1
+    elif i == 7: n = 10
+    elif i == 8: n = 11
+    elif i == 9: n = 100
+    elif i < 20: n = random.randint(10**17, MAX_VAL)
+    else:
+        if i < 50: n = random.randint(100, 100000)
+        else: n = random.randint(100000, 10**15)
+    return n
+
+def generate_file(i, f_in):
+    """
+    Writes the input of file i to f_in and returns the output text.
+    This is the per-file hook the tools/ scripts call.
+    """
+    seed_file("shreya", MASTER_SEED, i)
+    n = build_n(i)
+    f_in.write(f"{n}\n")
+    return f"{solve(n)}\n"
+
 def generate_test_cases():
     base_dir = "shreya_test_cases"
     input_dir = os.path.join(base_dir, "input")
@@ -22,36 +58,17 @@ def generate_test_cases():
     os.makedirs(input_dir, exist_ok=True)
     os.makedirs(output_dir, exist_ok=True)
 
-    NUM_FILES = 100
-    MAX_VAL = 10**18
-    
     print(f"🚀 Generating {NUM_FILES} CORRECT test files for Shreya...")
 
     for i in range(NUM_FILES):
         input_path = os.path.join(input_dir, f"input{i:02d}.txt")
         output_path = os.path.join(output_dir, f"output{i:02d}.txt")
         
-        n = 0
-        if i == 0: n = 1 
-        elif i == 1: n = 6
-        elif i == 2: n = 3
-        elif i == 3: n = 98
-        elif i == 4: n = 2
-        elif i == 5: n = MAX_VAL
-        elif i == 6: n = MAX_VAL - 1
-        elif i == 7: n = 10
-        elif i == 8: n = 11
-        elif i == 9: n = 100
-        elif i < 20: n = random.randint(10**17, MAX_VAL)
-        else:
-            if i < 50: n = random.randint(100, 100000)
-            else: n = random.randint(100000, 10**15)
-
         with open(input_path, 'w') as f_in:
-            f_in.write(f"{n}\n")
+            output_text = generate_file(i, f_in)
             
         with open(output_path, 'w') as f_out:
-            f_out.write(f"{solve(n)}\n")
+            f_out.write(output_text)
                 
     print(f"✅ Generated {NUM_FILES} files.")
     print("1. Open 'shreya_test_cases'.")
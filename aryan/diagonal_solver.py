@@ -0,0 +1,110 @@
+"""
+Closed-form solver shared by aryan/testcases.py and aryan/one_more/ahshit.py.
+
+Both reference solutions (the dp table in testcases.solve and the diagonal
+walk in ahshit.solve_python_logic) add, per diagonal, exactly enough chants
+to lift its minimum to 0. So the answer is
+
+    sum over all 2n-1 diagonals of max(0, -min(diagonal))
+
+which is computed here for every diagonal in one vectorized pass, or
+row by row in O(n) memory by DiagonalStream.
+"""
+try:
+    import numpy as np
+except ImportError:  # solve_diagonals falls back to plain Python below
+    np = None
+
+# DiagonalStream moves list rows at least this long into NumPy; shorter ones
+# are cheaper to fold in plain Python than to convert.
+STREAM_NUMPY_MIN_N = 64
+
+
+def diagonal_minima(grid):
+    """
+    Minimum of every diagonal j - i = k, for k = -(n-1) .. n-1.
+    The grid is sheared into an n x (2n-1) array whose column k + n - 1 holds
+    diagonal k; the padding is 0, which cannot change min(diagonal, 0).
+    Returns min(diagonal, 0) per diagonal.
+    """
+    a = np.asarray(grid, dtype=np.int64)
+    n = a.shape[0]
+    rows = np.arange(n)
+    sheared = np.zeros((n, 2 * n - 1), dtype=np.int64)
+    sheared[rows[:, None], rows[None, :] - rows[:, None] + n - 1] = a
+    return np.minimum(sheared.min(axis=0), 0)
+
+
+def solve_diagonals(grid):
+    """
+    Answer for one n x n grid (list of lists or NumPy array).
+    Returns a Python int, identical to the big-int reference answers:
+    |a| <= 1e9 over at most 2n-1 diagonals stays far inside int64.
+    """
+    n = len(grid)
+    if n == 0:
+        return 0
+    if np is not None:
+        return int(-diagonal_minima(grid).sum())
+
+    ans = 0
+    for k in range(-(n - 1), n):
+        start = max(0, -k)
+        minn = min(grid[i][i + k] for i in range(start, min(n, n - k)))
+        if minn < 0:
+            ans -= minn
+    return ans
+
+
+class DiagonalStream:
+    """
+    solve_diagonals for a grid fed one row at a time, in O(n) memory.
+
+    carry[j] is min(0, minimum so far of the diagonal through column j of
+    the last row). Row r+1 extends diagonal j to column j+1, starts a new
+    diagonal at column 0 and finishes the one that ran out at column n-1,
+    so the n-1 finished diagonals plus the n carried at the end are all
+    2n-1 of them.
+
+        stream = DiagonalStream(n)
+        for row in rows:
+            stream.add_row(row)  # A list or a NumPy row
+        answer = stream.answer()
+    """
+
+    def __init__(self, n):
+        self.n = n
+        self.carry = None
+        self.total = 0
+        self.numpy = np is not None and n >= STREAM_NUMPY_MIN_N
+
+    def add_row(self, row):
+        carry = self.carry
+        if self.numpy or (carry is None and np is not None and isinstance(row, np.ndarray)):
+            self.numpy = True
+            row = np.asarray(row, dtype=np.int64)
+            new = np.empty(self.n, dtype=np.int64)
+            new[0] = min(int(row[0]), 0)
+            if carry is None:
+                np.minimum(row[1:], 0, out=new[1:])
+            else:
+                self.total -= int(carry[-1])
+                np.minimum(row[1:], carry[:-1], out=new[1:])
+        elif carry is None:
+            new = [min(x, 0) for x in row] # Small NumPy rows work too, element by element
+        else:
+            self.total -= carry[-1]
+            new = [min(row[0], 0)]
+            new += map(min, row[1:], carry) # map stops at len(row) - 1: carry[:-1]
+        self.carry = new
+
+    def add_rows(self, block):
+        """Feeds every row of a 2-D block (or any iterable of rows) in order."""
+        for row in block:
+            self.add_row(row)
+
+    def answer(self):
+        if self.carry is None:
+            return 0
+        carried = int(self.carry.sum()) if not isinstance(self.carry, list) else sum(self.carry)
+        return self.total - carried
@@ -5,10 +5,39 @@ import sys
 # Increase recursion depth just in case, though not needed for this iterative logic
 sys.setrecursionlimit(2000)
 
+# The shared closed-form solver lives one level up, in aryan/diagonal_solver.py
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from diagonal_solver import DiagonalStream, np, solve_diagonals
+
+from tools.seeding import seed_file
+
+# --- THE KILLER CONFIGURATION ---
+# We want Total T = 200 with N = 500.
+# We split this into 5 files of T = 40 each to keep file size under 100MB.
+# `python -m tools.estimate ahshit --budget 100MB` predicts the size before a run.
+
+NUM_FILES = 5
+MASTER_SEED = 0
+T_PER_FILE = 40   # 40 * 5 = 200 Total Cases
+N = 500           # Max N
+
+# Streaming mode, for pushing N or T past what fits in memory:
+#   True  -> each grid is built, written and solved STREAM_BLOCK_ROWS rows at a
+#            time (one row at a time without NumPy), so memory stays O(N)
+#   False -> each grid is held whole (an N x N array and its text)
+# Without NumPy both modes write identical files. With NumPy the random
+# patterns (files 0 and 4) are drawn in blocks when streaming, which NumPy
+# does not promise to match one whole-grid draw: compare files within a mode.
+STREAM_ROWS = False
+STREAM_BLOCK_ROWS = 32
+
+MAX_VAL = 1_000_000_000
+MIN_VAL = -1_000_000_000
+
 def solve_python_logic(n, grid):
     """
     Python implementation of the User's C++ logic.
-    Used to generate correct outputs.
+    Kept as the reference; outputs are generated with solve_diagonals.
     """
     ans = 0
     
@@ -42,6 +71,178 @@ def solve_python_logic(n, grid):
 
     return ans
 
+def grid_rows(i):
+    """Yields the rows of one N x N grid following the strategy of file i."""
+    
+    # --- STRATEGY PER FILE ---
+    
+    # File 0: PURE RANDOM (I/O Killer)
+    if i == 0:
+        for _ in range(N):
+            row = [random.randint(MIN_VAL, MAX_VAL) for _ in range(N)]
+            yield row
+
+    # File 1: ALL NEGATIVE (Sum Overflow Killer)
+    # Forces 'ans' to become massive (~500 * 10^9)
+    elif i == 1:
+        for _ in range(N):
+            # Use a fixed large negative number
+            row = [-999999999] * N
+            yield row
+
+    # File 2: DIAGONAL STRESS (Logic Killer)
+    # Main diagonal is negative, everything else is positive.
+    # Forces the minn check to run fully every time.
+    elif i == 2:
+        for r in range(N):
+            row = []
+            for c in range(N):
+                if r == c:
+                    row.append(-100000) # Negative diagonal
+                else:
+                    row.append(100000)  # Positive background
+            yield row
+
+    # File 3: ALTERNATING (CPU Branch Prediction Killer)
+    # -1, 1, -1, 1... min check flips constantly
+    elif i == 3:
+        for r in range(N):
+            row = [(100 if (r+c)%2==0 else -100) for c in range(N)]
+            yield row
+
+    # File 4: RANDOM MIXED (Standard Heavy)
+    else:
+        for _ in range(N):
+            row = [random.randint(-10000, 10000) for _ in range(N)]
+            yield row
+
+def build_grid(i):
+    """Returns one N x N grid following the strategy of file i."""
+    return list(grid_rows(i))
+
+# --- KILLER PATTERNS (array form) ---
+# Same strategies as build_grid, one array expression each. Used when NumPy
+# is available; build_grid stays as the plain-Python fallback.
+# `rows` (an index array) builds only those rows of the grid; None = all.
+
+def row_indices(n, rows):
+    return np.arange(n) if rows is None else rows
+
+def pattern_random(n, rng, rows=None):
+    # PURE RANDOM (I/O Killer)
+    r = row_indices(n, rows)
+    return rng.integers(MIN_VAL, MAX_VAL, size=(len(r), n), endpoint=True)
+
+def pattern_all_negative(n, rng, rows=None):
+    # ALL NEGATIVE (Sum Overflow Killer)
+    return np.full((len(row_indices(n, rows)), n), -999999999, dtype=np.int64)
+
+def pattern_diagonal(n, rng, rows=None):
+    # DIAGONAL STRESS (Logic Killer): negative main diagonal, positive background
+    r = row_indices(n, rows)
+    return np.where(r[:, None] == np.arange(n)[None, :], -100000, 100000)
+
+def pattern_alternating(n, rng, rows=None):
+    # ALTERNATING (CPU Branch Prediction Killer): sign follows (r+c) % 2
+    r = row_indices(n, rows)
+    return np.where((r[:, None] + np.arange(n)[None, :]) % 2 == 0, 100, -100)
+
+def pattern_mixed(n, rng, rows=None):
+    # RANDOM MIXED (Standard Heavy)
+    r = row_indices(n, rows)
+    return rng.integers(-10000, 10000, size=(len(r), n), endpoint=True)
+
+# File index -> (grid builder, closed-form answer or None).
+# A closed form means the pattern is deterministic: its grid is built and
+# rendered once per file and repeated T_PER_FILE times.
+KILLER_PATTERNS = {
+    0: (pattern_random, None),
+    # Every one of the 2n-1 diagonals has minimum -999999999
+    1: (pattern_all_negative, lambda n: (2 * n - 1) * 999999999),
+    # Only the main diagonal is negative
+    2: (pattern_diagonal, lambda n: 100000),
+    # Diagonal j-i=k has constant parity k; the 2*(n//2) odd ones are all -100
+    3: (pattern_alternating, lambda n: 100 * 2 * (n // 2)),
+    4: (pattern_mixed, None),
+}
+
+def killer_pattern(i):
+    """KILLER_PATTERNS[i]; files past the table are random mixed, like grid_rows' else branch."""
+    return KILLER_PATTERNS.get(i, (pattern_mixed, None))
+
+def render_grid(grid):
+    """Text of an N x N array (or a block of its rows), one row per line."""
+    return "\n".join(" ".join(map(str, row)) for row in grid.tolist()) + "\n"
+
+def stream_grid(i, f_in, rng):
+    """
+    Writes one grid of file i block by block and returns its answer.
+    Only the current block of rows and DiagonalStream's O(N) carries are
+    in memory; deterministic patterns still use their closed form.
+    """
+    if np is None:
+        stream = DiagonalStream(N)
+        for row in grid_rows(i):
+            f_in.write(" ".join(map(str, row)) + "\n")
+            stream.add_row(row)
+        return stream.answer()
+
+    build, closed_form = killer_pattern(i)
+    stream = DiagonalStream(N) if closed_form is None else None
+    for start in range(0, N, STREAM_BLOCK_ROWS):
+        block = build(N, rng, np.arange(start, min(N, start + STREAM_BLOCK_ROWS)))
+        f_in.write(render_grid(block))
+        if stream is not None:
+            stream.add_rows(block)
+    return closed_form(N) if stream is None else stream.answer()
+
+def generate_file(i, f_in):
+    """
+    Writes the input of file i to f_in and returns the output text.
+    Random grids are built, written and solved one at a time; deterministic
+    patterns are rendered once and answered by their closed form.
+    With STREAM_ROWS no grid is held whole (see stream_grid).
+    This is the per-file hook the tools/ scripts call.
+    """
+    rng = seed_file("ahshit", MASTER_SEED, i)
+    f_in.write(f"{T_PER_FILE}\n")
+
+    answers = []
+    if STREAM_ROWS:
+        for t in range(T_PER_FILE):
+            f_in.write(f"{N}\n")
+            answers.append(f"{stream_grid(i, f_in, rng)}\n")
+        return "".join(answers)
+
+    if np is not None:
+        build, closed_form = killer_pattern(i)
+        if closed_form is not None:
+            grid_text = render_grid(build(N, rng))
+            answer = closed_form(N)
+            for t in range(T_PER_FILE):
+                f_in.write(f"{N}\n")
+                f_in.write(grid_text)
+                answers.append(f"{answer}\n")
+        else:
+            for t in range(T_PER_FILE):
+                f_in.write(f"{N}\n")
+                grid = build(N, rng)
+                f_in.write(render_grid(grid))
+                answers.append(f"{solve_diagonals(grid)}\n")
+        return "".join(answers)
+
+    for t in range(T_PER_FILE):
+        f_in.write(f"{N}\n")
+        grid = build_grid(i)
+
+        # --- WRITE INPUT ---
+        for row in grid:
+            f_in.write(" ".join(map(str, row)) + "\n")
+
+        # --- SOLVE & WRITE OUTPUT ---
+        answers.append(f"{solve_diagonals(grid)}\n")
+    return "".join(answers)
+
 def generate_killer_cases():
     base_dir = "aryan_killer_tests"
     input_dir = os.path.join(base_dir, "input")
@@ -50,17 +251,6 @@ def generate_killer_cases():
     os.makedirs(input_dir, exist_ok=True)
     os.makedirs(output_dir, exist_ok=True)
 
-    # --- THE KILLER CONFIGURATION ---
-    # We want Total T = 200 with N = 500.
-    # We split this into 5 files of T = 40 each to keep file size under 100MB.
-    
-    NUM_FILES = 5
-    T_PER_FILE = 40   # 40 * 5 = 200 Total Cases
-    N = 500           # Max N
-    
-    MAX_VAL = 1_000_000_000
-    MIN_VAL = -1_000_000_000
-
     print(f"🚀 Generating {NUM_FILES} files.")
     print(f"💀 LOAD PER FILE: T={T_PER_FILE}, N={N} (Total ~10 Million ints per file)")
     
@@ -70,63 +260,10 @@ def generate_killer_cases():
         
         print(f"  > Generating File {i:02d}...", end=" ")
         
-        with open(input_path, 'w') as f_in, open(output_path, 'w') as f_out:
-            f_in.write(f"{T_PER_FILE}\n")
-            
-            for t in range(T_PER_FILE):
-                f_in.write(f"{N}\n")
-                
-                grid = []
-                
-                # --- STRATEGY PER FILE ---
-                
-                # File 0: PURE RANDOM (I/O Killer)
-                if i == 0:
-                    for _ in range(N):
-                        row = [random.randint(MIN_VAL, MAX_VAL) for _ in range(N)]
-                        grid.append(row)
-
-                # File 1: ALL NEGATIVE (Sum Overflow Killer)
-                # Forces 'ans' to become massive (~500 * 10^9)
-                elif i == 1:
-                    for _ in range(N):
-                        # Use a fixed large negative number
-                        row = [-999999999] * N
-                        grid.append(row)
-
-                # File 2: DIAGONAL STRESS (Logic Killer)
-                # Main diagonal is negative, everything else is positive.
-                # Forces the minn check to run fully every time.
-                elif i == 2:
-                    for r in range(N):
-                        row = []
-                        for c in range(N):
-                            if r == c:
-                                row.append(-100000) # Negative diagonal
-                            else:
-                                row.append(100000)  # Positive background
-                        grid.append(row)
-
-                # File 3: ALTERNATING (CPU Branch Prediction Killer)
-                # -1, 1, -1, 1... min check flips constantly
-                elif i == 3:
-                    for r in range(N):
-                        row = [(100 if (r+c)%2==0 else -100) for c in range(N)]
-                        grid.append(row)
-
-                # File 4: RANDOM MIXED (Standard Heavy)
-                else:
-                    for _ in range(N):
-                        row = [random.randint(-10000, 10000) for _ in range(N)]
-                        grid.append(row)
-
-                # --- WRITE INPUT ---
-                for row in grid:
-                    f_in.write(" ".join(map(str, row)) + "\n")
-
-                # --- SOLVE & WRITE OUTPUT ---
-                ans = solve_python_logic(N, grid)
-                f_out.write(f"{ans}\n")
+        with open(input_path, 'w') as f_in:
+            output_text = generate_file(i, f_in)
+        with open(output_path, 'w') as f_out:
+            f_out.write(output_text)
         
         print("Done.")
 
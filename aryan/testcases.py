@@ -1,9 +1,34 @@
 import os
 import random
 
+from diagonal_solver import DiagonalStream, solve_diagonals
+
+from tools.cases import CaseBuffer
+from tools.seeding import seed_file
+
+# --- SETTINGS ---
+NUM_FILES = 60 # Reduced from 100 to save space
+MASTER_SEED = 0
+
+# Each "max" file has T=2, n=500. n^2 = 250,000. Sum(n^2) = 500,000
+# Each "random" file has Sum(n^2) <= 500,000
+# 500k numbers * 12 bytes/num = 6MB per file
+# 60 files * 6MB = 360MB (uncompressed) -> Zips to ~80-90MB
+# `python -m tools.estimate aryan --budget 90MB` re-checks this math by sampling.
+SUM_N_SQUARED_PER_FILE = 500_000
+MAX_N = 500
+MAX_VAL = 10**9
+
+# How the max-size random grids (files 10-19) are held:
+#   True  -> drawn, written and solved one row at a time (one row in memory)
+#   False -> built as a full list of lists first
+# Both draw the same random numbers in the same order: the files are identical.
+STREAM_ROWS = True
+
 def solve(grid):
     """
-    This is the O(n^2) DP solution.
+    This is the O(n^2) DP solution (kept as the reference; the generator
+    uses the closed form in diagonal_solver.py).
     dp[i][j] = total chants that have been applied *at or above* (i, j)
                on the same diagonal.
     total_answer = sum of chants we have to add at each step.
@@ -40,6 +65,106 @@ def solve(grid):
             
     return total_answer
 
+class RandomRows:
+    """
+    A random n x n grid that is never held: iterating it draws each row only
+    when it is asked for. Iterate it once, before the next case's rows.
+    """
+    def __init__(self, n, low, high):
+        self.n = n
+        self.low = low
+        self.high = high
+
+    def __len__(self):
+        return self.n
+
+    def __iter__(self):
+        for _ in range(self.n):
+            yield [random.randint(self.low, self.high) for _ in range(self.n)]
+
+def build_cases(i):
+    """
+    Returns the grids of file index i: a CaseBuffer of (n,) headers and
+    n x n values. With STREAM_ROWS the grids of files 10-19 are added as
+    streams of RandomRows, drawn only when written.
+    """
+    test_cases_in = CaseBuffer()
+    current_n_squared_sum = 0
+    
+    # --- Strategy for this file ---
+    
+    # File 00-09: Manual Edge Cases (10 files)
+    if i == 0:
+        # Sample 1
+        test_cases_in.add_grid((3,), [[-1, -1, 4], [-1, -1, 4], [-1, -1, 4]])
+        # Sample 2
+        test_cases_in.add_grid((2,), [[-1, -2], [-3, -4]])
+    elif i == 1:
+        # n=1 cases
+        test_cases_in.add_grid((1,), [[-10]])
+        test_cases_in.add_grid((1,), [[10]])
+        test_cases_in.add_grid((1,), [[-MAX_VAL]]) # Forces long long
+    elif i == 2:
+        # All positive
+        test_cases_in.add_grid((2,), [[1, 2], [3, 4]])
+    elif i == 3:
+        # All negative (forces long long overflow for answer)
+        grid = [[-MAX_VAL] * 10 for _ in range(10)] # 10*10 = 100
+        test_cases_in.add_grid((10,), grid)
+    elif i < 10:
+         # Other small edge cases
+        test_cases_in.add_grid((5,), RandomRows(5, -100, 100))
+
+    # File 10-19: MAX CONSTRAINTS (TLE cases for O(n^3))
+    # 10 files as requested.
+    elif i < 20:
+        # Each file gets 2 test cases of n=500
+        # 2 * 500^2 = 500,000
+        T = 2
+        n = 500 
+        for _ in range(T):
+            if current_n_squared_sum + n*n <= SUM_N_SQUARED_PER_FILE:
+                grid = RandomRows(n, -MAX_VAL, MAX_VAL)
+                if STREAM_ROWS:
+                    test_cases_in.add_stream((n,), grid)
+                else:
+                    test_cases_in.add_grid((n,), grid)
+                current_n_squared_sum += n*n
+
+    # File 20-59: High T, Small N (Random)
+    else:
+        while current_n_squared_sum < SUM_N_SQUARED_PER_FILE:
+            n = random.randint(1, 22) # n*n is at most 484
+            if current_n_squared_sum + n*n > SUM_N_SQUARED_PER_FILE:
+                break
+            test_cases_in.add_grid((n,), RandomRows(n, -100, 100))
+            current_n_squared_sum += n*n
+
+    return test_cases_in
+
+def generate_file(i, f_in):
+    """
+    Writes the input of file i to f_in and returns the output text.
+    This is the per-file hook the tools/ scripts call.
+    """
+    seed_file("aryan", MASTER_SEED, i)
+    test_cases_in = build_cases(i)
+    f_in.write(f"{len(test_cases_in)}\n") # Write T
+    
+    answers = []
+    for k in range(len(test_cases_in)):
+        if test_cases_in.is_streamed(k):
+            # A streamed grid is solved as its rows go by; it is never kept
+            (n,) = test_cases_in.headers[k]
+            stream = DiagonalStream(n)
+            test_cases_in.write_case(f_in, k, on_row=stream.add_row)
+            answers.append(f"{stream.answer()}\n")
+        else:
+            test_cases_in.write_case(f_in, k)
+            # Solve the NumPy view of the buffer and write the answer
+            answers.append(f"{solve_diagonals(test_cases_in.grid(k))}\n")
+    return "".join(answers)
+
 def generate_test_cases():
     base_dir = "aryan_test_cases"
     input_dir = os.path.join(base_dir, "input")
@@ -48,88 +173,16 @@ def generate_test_cases():
     os.makedirs(input_dir, exist_ok=True)
     os.makedirs(output_dir, exist_ok=True)
 
-    # --- SETTINGS ---
-    NUM_FILES = 60 # Reduced from 100 to save space
-    
-    # Each "max" file has T=2, n=500. n^2 = 250,000. Sum(n^2) = 500,000
-    # Each "random" file has Sum(n^2) <= 500,000
-    # 500k numbers * 12 bytes/num = 6MB per file
-    # 60 files * 6MB = 360MB (uncompressed) -> Zips to ~80-90MB
-    SUM_N_SQUARED_PER_FILE = 500_000
-    MAX_N = 500
-    MAX_VAL = 10**9
-    
     print(f"🚀 Generating {NUM_FILES} test files (under 90MB) for Aryan...")
 
     for i in range(NUM_FILES):
         input_path = os.path.join(input_dir, f"input{i:02d}.txt")
         output_path = os.path.join(output_dir, f"output{i:02d}.txt")
         
-        test_cases_in = []
-        current_n_squared_sum = 0
-        
-        # --- Strategy for this file ---
-        
-        # File 00-09: Manual Edge Cases (10 files)
-        if i == 0:
-            # Sample 1
-            test_cases_in.append([[-1, -1, 4], [-1, -1, 4], [-1, -1, 4]])
-            # Sample 2
-            test_cases_in.append([[-1, -2], [-3, -4]])
-        elif i == 1:
-            # n=1 cases
-            test_cases_in.append([[-10]])
-            test_cases_in.append([[10]])
-            test_cases_in.append([[-MAX_VAL]]) # Forces long long
-        elif i == 2:
-            # All positive
-            test_cases_in.append([[1, 2], [3, 4]])
-        elif i == 3:
-            # All negative (forces long long overflow for answer)
-            grid = [[-MAX_VAL] * 10 for _ in range(10)] # 10*10 = 100
-            test_cases_in.append(grid)
-        elif i < 10:
-             # Other small edge cases
-            grid = [[random.randint(-100, 100) for _ in range(5)] for _ in range(5)]
-            test_cases_in.append(grid)
-
-        # File 10-19: MAX CONSTRAINTS (TLE cases for O(n^3))
-        # 10 files as requested.
-        elif i < 20:
-            # Each file gets 2 test cases of n=500
-            # 2 * 500^2 = 500,000
-            T = 2
-            n = 500 
-            for _ in range(T):
-                if current_n_squared_sum + n*n <= SUM_N_SQUARED_PER_FILE:
-                    grid = [[random.randint(-MAX_VAL, MAX_VAL) for _ in range(n)] for _ in range(n)]
-                    test_cases_in.append(grid)
-                    current_n_squared_sum += n*n
-
-        # File 20-59: High T, Small N (Random)
-        else:
-            while current_n_squared_sum < SUM_N_SQUARED_PER_FILE:
-                n = random.randint(1, 22) # n*n is at most 484
-                if current_n_squared_sum + n*n > SUM_N_SQUARED_PER_FILE:
-                    break
-                grid = [[random.randint(-100, 100) for _ in range(n)] for _ in range(n)]
-                test_cases_in.append(grid)
-                current_n_squared_sum += n*n
-
-
-        # --- Write files ---
-        with open(input_path, 'w') as f_in, open(output_path, 'w') as f_out:
-            f_in.write(f"{len(test_cases_in)}\n") # Write T
-            
-            for grid in test_cases_in:
-                n = len(grid)
-                f_in.write(f"{n}\n")
-                for row in grid:
-                    f_in.write(" ".join(map(str, row)) + "\n")
-                
-                # Solve and write the answer
-                answer = solve(grid)
-                f_out.write(f"{answer}\n")
+        with open(input_path, 'w') as f_in:
+            output_text = generate_file(i, f_in)
+        with open(output_path, 'w') as f_out:
+            f_out.write(output_text)
                 
     print(f"✅ Generated {NUM_FILES} files in '{base_dir}/'.")
     print("⚠️  Total zip size should be safely under 90MB.")
@@ -2,6 +2,23 @@ import os
 import random
 import string
 
+from tools.seeding import seed_file
+
+# --- SETTINGS ---
+NUM_FILES = 100
+MASTER_SEED = 0
+# 400k chars per file -> ~80MB total zip size. Safe.
+SUM_S_PER_FILE = 400_000 
+
+# Use safe characters (no whitespace) so cin >> s works perfectly
+SAFE_CHARS = string.ascii_letters + string.digits + "!@#$%^&*()_+-=[]{}|;:,.<>?"
+SAFE_BYTES = SAFE_CHARS.encode("ascii")
+
+# String construction backend:
+#   "str"   -> random.choices + dict mapping (one Python step per character)
+#   "bytes" -> bulk random bytes mapped through translate tables
+BACKEND = "bytes"
+
 def solve(s, t):
     """
     O(N) solution for Isomorphic Strings.
@@ -30,6 +47,191 @@ def solve(s, t):
             
     return "YES"
 
+def signature(data):
+    """
+    First-occurrence signature of a byte string: every byte is replaced by the
+    rank of its first appearance, e.g. b"paper" -> 0 1 0 2 3.
+    set/index/translate keep the whole pass in C (at most 256 distinct bytes).
+    """
+    firsts = bytes(sorted(set(data), key=data.index))
+    return data.translate(bytes.maketrans(firsts, bytes(range(len(firsts)))))
+
+def solve_fast(s, t):
+    """
+    Same answer as solve() without a per-character Python loop.
+    Two strings are isomorphic exactly when their first-occurrence
+    signatures are equal. Accepts str or bytes.
+    """
+    if len(s) != len(t):
+        return "NO"
+    if isinstance(s, str) or isinstance(t, str):
+        try:
+            s = s.encode("latin-1") if isinstance(s, str) else s
+            t = t.encode("latin-1") if isinstance(t, str) else t
+        except UnicodeEncodeError:
+            return solve(s, t) # Signatures are byte-wide; fall back
+    return "YES" if signature(s) == signature(t) else "NO"
+
+# ==========================================
+# STRING BUILDERS
+# ==========================================
+
+def random_str(n):
+    return "".join(random.choices(SAFE_CHARS, k=n))
+
+def isomorphic_str(s):
+    """Image of s under a random bijection onto SAFE_CHARS."""
+    chars_s = list(set(s))
+    if len(chars_s) > len(SAFE_CHARS): # Fallback
+        return s
+    chars_t = random.sample(SAFE_CHARS, len(chars_s))
+    mapping = dict(zip(chars_s, chars_t))
+    return "".join(mapping[c] for c in s)
+
+def tricky_no_str(s, n):
+    """
+    Tricky failure: s[0]!=s[1] but t[0]==t[1].
+    Returns the (possibly patched) s and a fresh random t.
+    """
+    s_list = list(s)
+    t_list = list(random_str(n))
+    
+    # Force t[0] == t[1]
+    t_list[1] = t_list[0]
+    
+    # Force s[0] != s[1]
+    if s_list[0] == s_list[1]:
+        new_char = random.choice(SAFE_CHARS)
+        while new_char == s_list[0]:
+            new_char = random.choice(SAFE_CHARS)
+        s_list[1] = new_char
+        
+    return "".join(s_list), "".join(t_list)
+
+# Random bytes below _ACCEPTED map evenly onto SAFE_BYTES (two copies of the
+# alphabet); the rest are dropped so every safe char stays equally likely.
+_ACCEPTED = 256 - 256 % len(SAFE_BYTES)
+_REJECTED = bytes(range(_ACCEPTED, 256))
+_TO_SAFE = bytes.maketrans(bytes(range(_ACCEPTED)),
+                           SAFE_BYTES * (_ACCEPTED // len(SAFE_BYTES)))
+
+def random_bytes(n):
+    """Bytes version of random_str: one randbytes + one translate per chunk."""
+    out = b""
+    while len(out) < n:
+        need = n - len(out)
+        out += random.randbytes(2 * need + 16).translate(_TO_SAFE, _REJECTED)
+    return out[:n]
+
+def isomorphic_bytes(s):
+    """Image of s under a random permutation of SAFE_BYTES, via translate."""
+    image = bytes(random.sample(SAFE_BYTES, len(SAFE_BYTES)))
+    return s.translate(bytes.maketrans(SAFE_BYTES, image))
+
+def tricky_no_bytes(s, n):
+    """Bytes version of tricky_no_str; only two positions are touched."""
+    s = bytearray(s)
+    t = bytearray(random_bytes(n))
+    
+    # Force t[0] == t[1]
+    t[1] = t[0]
+    
+    # Force s[0] != s[1]
+    if s[0] == s[1]:
+        new_char = random.choice(SAFE_BYTES)
+        while new_char == s[0]:
+            new_char = random.choice(SAFE_BYTES)
+        s[1] = new_char
+        
+    return bytes(s), bytes(t)
+
+# ==========================================
+# PER-FILE STRATEGY
+# ==========================================
+
+def build_cases(i):
+    """Returns the (s, t) cases for file index i (str or bytes, per BACKEND)."""
+    if BACKEND == "bytes":
+        rand, isomorphic, tricky_no = random_bytes, isomorphic_bytes, tricky_no_bytes
+    else:
+        rand, isomorphic, tricky_no = random_str, isomorphic_str, tricky_no_str
+
+    test_cases_in = []
+    current_s_sum = 0
+    
+    # --- Strategy ---
+    
+    # File 00-09: Manual Edge Cases
+    if i == 0:
+        test_cases_in = [("egg", "add"), ("foo", "bar"), ("paper", "title"), ("baba", "kiki"), ("badc", "baba")]
+    elif i == 1:
+        test_cases_in = [("a", "a"), ("a", "b"), ("ab", "aa"), ("aa", "ab"), ("abc", "def")]
+    elif i == 2:
+        test_cases_in = [("a", "ab"), ("ab", "a"), ("hello", "world!"), ("123", "456")]
+    elif i < 10:
+        # Short random strings
+        while current_s_sum < 10000: 
+            n = random.randint(1, 20)
+            s = rand(n)
+            if random.random() > 0.5: # YES
+                # Valid mapping
+                t = isomorphic(s)
+            else: # NO
+                t = rand(n)
+            test_cases_in.append((s, t))
+            current_s_sum += n
+
+    # File 10-39: High T, Small N (Stress loop)
+    elif i < 40:
+        while current_s_sum < SUM_S_PER_FILE - 100:
+            n = random.randint(1, 100)
+            s = rand(n)
+            # 50/50 chance YES/NO
+            if random.random() > 0.5:
+                t = isomorphic(s)
+            else:
+                t = rand(n)
+            test_cases_in.append((s, t))
+            current_s_sum += n
+
+    # File 40-99: MAX CONSTRAINTS (TLE check for inefficient solutions)
+    else:
+        # ~4 cases per file, each with N=100k
+        T = 4
+        n = 100_000 
+        for _ in range(T):
+            s = rand(n)
+            
+            if random.random() > 0.5: # YES case
+                t = isomorphic(s)
+            else: # NO case
+                s, t = tricky_no(s, n)
+
+            test_cases_in.append((s, t))
+
+    return test_cases_in
+
+def generate_file(i, f_in):
+    """
+    Writes the input of file i to the binary stream f_in and returns the
+    output text. This is the per-file hook the tools/ scripts call.
+    """
+    seed_file("atharv", MASTER_SEED, i)
+    test_cases_in = build_cases(i)
+    f_in.write(f"{len(test_cases_in)}\n".encode()) # Write T
+    
+    answers = []
+    for s, t in test_cases_in:
+        if isinstance(s, str): s = s.encode("ascii")
+        if isinstance(t, str): t = t.encode("ascii")
+        # Handle empty edge case just in case
+        if not s: s = b"a"
+        if not t: t = b"a"
+        
+        f_in.write(s + b" " + t + b"\n") # Write on one line for cin >> s >> t
+        answers.append(f"{solve_fast(s, t)}\n")
+    return "".join(answers)
+
 def generate_test_cases():
     base_dir = "atharv_test_cases"
     input_dir = os.path.join(base_dir, "input")
@@ -38,118 +240,17 @@ def generate_test_cases():
     os.makedirs(input_dir, exist_ok=True)
     os.makedirs(output_dir, exist_ok=True)
 
-    NUM_FILES = 100
-    # 400k chars per file -> ~80MB total zip size. Safe.
-    SUM_S_PER_FILE = 400_000 
-    
-    # Use safe characters (no whitespace) so cin >> s works perfectly
-    SAFE_CHARS = string.ascii_letters + string.digits + "!@#$%^&*()_+-=[]{}|;:,.<>?"
-
     print(f"🚀 Generating {NUM_FILES} test files for Atharv...")
 
     for i in range(NUM_FILES):
         input_path = os.path.join(input_dir, f"input{i:02d}.txt")
         output_path = os.path.join(output_dir, f"output{i:02d}.txt")
         
-        test_cases_in = []
-        current_s_sum = 0
-        
-        # --- Strategy ---
-        
-        # File 00-09: Manual Edge Cases
-        if i == 0:
-            test_cases_in = [("egg", "add"), ("foo", "bar"), ("paper", "title"), ("baba", "kiki"), ("badc", "baba")]
-        elif i == 1:
-            test_cases_in = [("a", "a"), ("a", "b"), ("ab", "aa"), ("aa", "ab"), ("abc", "def")]
-        elif i == 2:
-            test_cases_in = [("a", "ab"), ("ab", "a"), ("hello", "world!"), ("123", "456")]
-        elif i < 10:
-            # Short random strings
-            while current_s_sum < 10000: 
-                n = random.randint(1, 20)
-                s = "".join(random.choices(SAFE_CHARS, k=n))
-                if random.random() > 0.5: # YES
-                    # Valid mapping
-                    chars_s = list(set(s))
-                    if len(chars_s) > len(SAFE_CHARS): # Fallback
-                        t = s
-                    else:
-                        chars_t = random.sample(SAFE_CHARS, len(chars_s))
-                        mapping = dict(zip(chars_s, chars_t))
-                        t = "".join(mapping[c] for c in s)
-                else: # NO
-                    t = "".join(random.choices(SAFE_CHARS, k=n))
-                test_cases_in.append((s, t))
-                current_s_sum += n
-
-        # File 10-39: High T, Small N (Stress loop)
-        elif i < 40:
-            while current_s_sum < SUM_S_PER_FILE - 100:
-                n = random.randint(1, 100)
-                s = "".join(random.choices(SAFE_CHARS, k=n))
-                # 50/50 chance YES/NO
-                if random.random() > 0.5:
-                    chars_s = list(set(s))
-                    if len(chars_s) > len(SAFE_CHARS):
-                        t = s
-                    else:
-                        chars_t = random.sample(SAFE_CHARS, len(chars_s))
-                        mapping = dict(zip(chars_s, chars_t))
-                        t = "".join(mapping[c] for c in s)
-                else:
-                    t = "".join(random.choices(SAFE_CHARS, k=n))
-                test_cases_in.append((s, t))
-                current_s_sum += n
-
-        # File 40-99: MAX CONSTRAINTS (TLE check for inefficient solutions)
-        else:
-            # ~4 cases per file, each with N=100k
-            T = 4
-            n = 100_000 
-            for _ in range(T):
-                s = "".join(random.choices(SAFE_CHARS, k=n))
-                
-                if random.random() > 0.5: # YES case
-                    chars_s = list(set(s))
-                    if len(chars_s) > len(SAFE_CHARS):
-                        t = s
-                    else:
-                        chars_t = random.sample(SAFE_CHARS, len(chars_s))
-                        mapping = dict(zip(chars_s, chars_t))
-                        t = "".join(mapping[c] for c in s)
-                else: # NO case
-                    # Create tricky failure: s[0]!=s[1] but t[0]==t[1]
-                    s_list = list(s)
-                    t_list = list("".join(random.choices(SAFE_CHARS, k=n)))
-                    
-                    # Force t[0] == t[1]
-                    t_list[1] = t_list[0]
-                    
-                    # Force s[0] != s[1]
-                    if s_list[0] == s_list[1]:
-                        new_char = random.choice(SAFE_CHARS)
-                        while new_char == s_list[0]:
-                            new_char = random.choice(SAFE_CHARS)
-                        s_list[1] = new_char
-                        
-                    s = "".join(s_list)
-                    t = "".join(t_list)
-
-                test_cases_in.append((s, t))
-
         # --- Write files ---
-        with open(input_path, 'w') as f_in, open(output_path, 'w') as f_out:
-            f_in.write(f"{len(test_cases_in)}\n") # Write T
-            
-            for s, t in test_cases_in:
-                # Handle empty edge case just in case
-                if not s: s = "a"
-                if not t: t = "a"
-                
-                f_in.write(f"{s} {t}\n") # Write on one line for cin >> s >> t
-                
-                answer = solve(s, t)
-                f_out.write(f"{answer}\n")
+        with open(input_path, 'wb') as f_in:
+            output_text = generate_file(i, f_in)
+        with open(output_path, 'w') as f_out:
+            f_out.write(output_text)
                 
     print(f"✅ Generated {NUM_FILES} files in '{base_dir}/'.")
     print("⚠️  Total zip size should be ~80MB (Safe).")
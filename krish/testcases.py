@@ -1,20 +1,49 @@
+import io
 import os
 import random
 import shutil
 import zipfile
 
+try:
+    import numpy as np
+except ImportError:  # The "list" engine below only needs the standard library
+    np = None
+
+from tools.seeding import seed_file
+
 # ==========================================
 # CONFIGURATION
 # ==========================================
 NUM_FILES = 100
+MASTER_SEED = 0
 OUTPUT_DIR = "test_cases"
-INPUT_DIR = os.path.join(OUTPUT_DIR, "input")
-OUTPUT_SUBDIR = os.path.join(OUTPUT_DIR, "output")
 ZIP_NAME = "krish_stack_overflow_tests.zip"
 
+# Where generated files go:
+#   "zip" -> each member is streamed straight into ZIP_NAME (no scratch files)
+#   "dir" -> files are written under OUTPUT_DIR, then zipped from there
+OUTPUT_SINK = "zip"
+
 # Max constraints per problem statement
 MAX_NM_SUM = 10**6  # Sum of N*M over all test cases in one file
 
+# Size knobs for the random files (05-94); files 95-99 are fixed max cases.
+# Slightly reduced targets keep the zip size manageable.
+# `python -m tools.estimate krish --budget 85MB` suggests values for a budget.
+TARGET_NM = 200_000         # Files 05-84
+STRESS_TARGET_NM = 500_000  # Files 85-94 (High Stress but not Max)
+
+# Case construction backend:
+#   "list"  -> make_valid_case / make_invalid_case (pure Python lists)
+#   "numpy" -> make_valid_case_np / make_invalid_case_np (one int array per case)
+ENGINE = "numpy" if np is not None else "list"
+
+# Outputs are solved from the in-memory cases with solve_fast.
+# Set to True to also re-read every written input, solve it with the
+# reference solve() and compare (slow: full re-parse + sort per row).
+# Runs once every file has been written to the sink.
+VERIFY_ROUNDTRIP = False
+
 # ==========================================
 # THE SOLVER (Python version of Correct Logic)
 # ==========================================
@@ -52,17 +81,47 @@ def solve(n, m, matrix):
         
     return " ".join(map(str, p))
 
-def generate_output_for_file(input_filepath, output_filepath):
-    with open(input_filepath, 'r') as fin:
-        lines = fin.read().split()
-    
-    iterator = iter(lines)
+def solve_fast(n, m, matrix):
+    """
+    Sort-free solver for in-memory cases.
+    Relies on the input guarantee that the values are exactly 0..nm-1:
+    a row is the AP start, start+n, ... iff all its values share one residue
+    mod n, and that residue is the row minimum (the start value).
+    O(m) per row; a NumPy matrix is checked for all rows in one batch.
+    Returns the same string as solve().
+    """
+    if np is not None and isinstance(matrix, np.ndarray):
+        residues = matrix % n
+        starts = residues[:, 0]
+        if not (residues == starts[:, None]).all():
+            return "-1"
+        starts = starts.tolist()
+    else:
+        starts = []
+        for row in matrix:
+            start_val = row[0] % n
+            for x in row:
+                if x % n != start_val:
+                    return "-1"
+            starts.append(start_val)
+
+    p = [-1] * n
+    for i, start_val in enumerate(starts):
+        if p[start_val] != -1:
+            return "-1"
+        p[start_val] = i + 1
+
+    return " ".join(map(str, p))
+
+def read_cases(text):
+    """Parses the text of an input file back into (n, m, matrix) tuples."""
+    iterator = iter(text.split())
     try:
         t = int(next(iterator))
     except StopIteration:
-        return
+        return []
 
-    results = []
+    cases = []
     for _ in range(t):
         n = int(next(iterator))
         m = int(next(iterator))
@@ -72,12 +131,26 @@ def generate_output_for_file(input_filepath, output_filepath):
             for _ in range(m):
                 row.append(int(next(iterator)))
             matrix.append(row)
-        
-        results.append(solve(n, m, matrix))
+        cases.append((n, m, matrix))
+    return cases
+
+def generate_output_for_file(input_filepath, output_filepath):
+    with open(input_filepath, 'r') as fin:
+        cases = read_cases(fin.read())
+    results = [solve(n, m, matrix) for n, m, matrix in cases]
     
     with open(output_filepath, 'w') as fout:
         fout.write("\n".join(results))
 
+def verify_output(input_text, output_text, name):
+    """
+    Round-trip check: re-solves a written input with the reference solve()
+    and compares against the written output.
+    """
+    expected = [solve(n, m, matrix) for n, m, matrix in read_cases(input_text)]
+    if output_text.split("\n") != expected:
+        raise RuntimeError(f"Round-trip mismatch for {name}")
+
 # ==========================================
 # TEST CASE GENERATORS
 # ==========================================
@@ -126,138 +199,259 @@ def make_invalid_case(n, m):
         
     return matrix
 
+def make_valid_case_np(n, m, rng=None):
+    """
+    Array-backed version of make_valid_case.
+    Same strategy, done in bulk:
+    1. One permutation gives every row its start value.
+    2. Broadcasting start + k*n builds the whole AP matrix at once.
+    3. rng.permuted shuffles each row independently in a single call.
+    Returns an (n, m) int64 array.
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    starts = rng.permutation(n)
+    matrix = starts[:, None] + n * np.arange(m)[None, :]
+    return rng.permuted(matrix, axis=1)
+
+def make_invalid_case_np(n, m, rng=None):
+    """
+    Array-backed version of make_invalid_case.
+    The swap between two distinct rows is a single fancy-indexed assignment.
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    matrix = make_valid_case_np(n, m, rng)
+
+    if n > 1 and m > 1:
+        r1, r2 = rng.choice(n, size=2, replace=False)
+        c1, c2 = rng.integers(0, m, size=2)
+        matrix[[r1, r2], [c1, c2]] = matrix[[r2, r1], [c2, c1]]
+
+    return matrix
+
+def format_row(row):
+    """Space-separated row for the input file (list or NumPy row)."""
+    if np is not None and isinstance(row, np.ndarray):
+        row = row.tolist()
+    return " ".join(map(str, row))
+
 # ==========================================
-# MAIN EXECUTION
+# PER-FILE STRATEGY
 # ==========================================
 
-def main():
-    if os.path.exists(OUTPUT_DIR):
-        shutil.rmtree(OUTPUT_DIR)
-    os.makedirs(INPUT_DIR)
-    os.makedirs(OUTPUT_SUBDIR)
+def build_cases(i, rng=None):
+    """Returns the (n, m, matrix) cases for file index i; rng feeds the numpy engine."""
+    if ENGINE == "numpy":
+        if rng is None:
+            rng = np.random.default_rng()
+        make_valid = lambda n, m: make_valid_case_np(n, m, rng)
+        make_invalid = lambda n, m: make_invalid_case_np(n, m, rng)
+    else:
+        make_valid, make_invalid = make_valid_case, make_invalid_case
 
-    print(f"Generating {NUM_FILES} test files...")
+    cases = []
+    
+    # --- LOGIC FOR VARIETY ---
+    
+    # 1. EDGE CASES (Files 00-05)
+    if i == 0: # Minimal Valid
+        cases = [(1, 1, make_valid(1, 1))]
+    elif i == 1: # Minimal N, Large M
+        cases = [(1, 100, make_valid(1, 100))]
+    elif i == 2: # Large N, Minimal M
+        cases = [(100, 1, make_valid(100, 1))]
+    elif i == 3: # Small Invalid (N>1, M>1)
+        cases = [(2, 2, make_invalid(2, 2))]
+    elif i == 4: # Mixed small
+        cases = [
+            (2, 3, make_valid(2, 3)),
+            (3, 2, make_invalid(3, 2)),
+            (1, 5, make_valid(1, 5))
+        ]
+        
+    # 2. ABSOLUTE MAXIMUM CONSTRAINTS (Files 95-99)
+    # Explicitly forcing N=1000, M=1000 (10^6 elements)
+    elif i == 95:
+        # Max N, Small M
+        cases = [(1000, 50, make_valid(1000, 50))] 
+    elif i == 96:
+        # Small N, Max M
+        cases = [(50, 1000, make_valid(50, 1000))]
+    elif i == 97:
+        # Max Square (Valid) - Half Max
+        cases = [(700, 700, make_valid(700, 700))]
+    elif i == 98:
+        # ABSOLUTE MAX VALID: 1000x1000
+        print(f"  -> Generating Absolute Max Valid Case (1000x1000) for file {i}")
+        cases = [(1000, 1000, make_valid(1000, 1000))]
+    elif i == 99:
+        # ABSOLUTE MAX INVALID: 1000x1000
+        print(f"  -> Generating Absolute Max Invalid Case (1000x1000) for file {i}")
+        cases = [(1000, 1000, make_invalid(1000, 1000))]
 
-    for i in range(NUM_FILES):
-        file_id = f"{i:02}"
-        cases = []
+    # 3. RANDOM MEDIUM/LARGE CASES (Files 05-94)
+    else:
+        # Regular random generation logic
+        t = random.randint(5, 20)
+        current_nm = 0
         
-        # --- LOGIC FOR VARIETY ---
+        # The huge files are handled explicitly in 95-99
+        target_nm = TARGET_NM
         
-        # 1. EDGE CASES (Files 00-05)
-        if i == 0: # Minimal Valid
-            cases = [(1, 1, make_valid_case(1, 1))]
-        elif i == 1: # Minimal N, Large M
-            cases = [(1, 100, make_valid_case(1, 100))]
-        elif i == 2: # Large N, Minimal M
-            cases = [(100, 1, make_valid_case(100, 1))]
-        elif i == 3: # Small Invalid (N>1, M>1)
-            cases = [(2, 2, make_invalid_case(2, 2))]
-        elif i == 4: # Mixed small
-            cases = [
-                (2, 3, make_valid_case(2, 3)),
-                (3, 2, make_invalid_case(3, 2)),
-                (1, 5, make_valid_case(1, 5))
-            ]
-            
-        # 2. ABSOLUTE MAXIMUM CONSTRAINTS (Files 95-99)
-        # Explicitly forcing N=1000, M=1000 (10^6 elements)
-        elif i == 95:
-            # Max N, Small M
-            cases = [(1000, 50, make_valid_case(1000, 50))] 
-        elif i == 96:
-            # Small N, Max M
-            cases = [(50, 1000, make_valid_case(50, 1000))]
-        elif i == 97:
-            # Max Square (Valid) - Half Max
-            cases = [(700, 700, make_valid_case(700, 700))]
-        elif i == 98:
-            # ABSOLUTE MAX VALID: 1000x1000
-            print(f"  -> Generating Absolute Max Valid Case (1000x1000) for file {i}")
-            cases = [(1000, 1000, make_valid_case(1000, 1000))]
-        elif i == 99:
-            # ABSOLUTE MAX INVALID: 1000x1000
-            print(f"  -> Generating Absolute Max Invalid Case (1000x1000) for file {i}")
-            cases = [(1000, 1000, make_invalid_case(1000, 1000))]
-
-        # 3. RANDOM MEDIUM/LARGE CASES (Files 05-94)
-        else:
-            # Regular random generation logic
-            t = random.randint(5, 20)
-            current_nm = 0
+        # Logic for files 85-94 (High Stress but not Max)
+        if i >= 85:
+             target_nm = STRESS_TARGET_NM
+             t = 100 # Loop limit, likely breaks on size first
+
+        for _ in range(t):
+            # Random dimensions
+            n = random.randint(1, 100)
+            m = random.randint(1, 100)
             
-            # Slightly reduced target for normal files to keep zip size manageable
-            # The huge files are handled explicitly in 95-99
-            TARGET_NM = 200000 
+            # Scale up for the higher file numbers
+            if i >= 50:
+                if random.random() < 0.5:
+                    n = random.randint(100, 500)
+                    m = random.randint(1, 100)
+                else:
+                    n = random.randint(1, 100)
+                    m = random.randint(100, 500)
+
+            # Safety break for size
+            if current_nm + (n*m) > MAX_NM_SUM:
+                break
             
-            # Logic for files 85-94 (High Stress but not Max)
-            if i >= 85:
-                 TARGET_NM = 500000
-                 t = 100 # Loop limit, likely breaks on size first
-
-            for _ in range(t):
-                # Random dimensions
-                n = random.randint(1, 100)
-                m = random.randint(1, 100)
-                
-                # Scale up for the higher file numbers
-                if i >= 50:
-                    if random.random() < 0.5:
-                        n = random.randint(100, 500)
-                        m = random.randint(1, 100)
-                    else:
-                        n = random.randint(1, 100)
-                        m = random.randint(100, 500)
-
-                # Safety break for size
-                if current_nm + (n*m) > MAX_NM_SUM:
-                    break
-                
-                if random.random() < 0.6:
-                    cases.append((n, m, make_valid_case(n, m)))
+            if random.random() < 0.6:
+                cases.append((n, m, make_valid(n, m)))
+            else:
+                if n > 1 and m > 1:
+                    cases.append((n, m, make_invalid(n, m)))
                 else:
-                    if n > 1 and m > 1:
-                        cases.append((n, m, make_invalid_case(n, m)))
-                    else:
-                        cases.append((n, m, make_valid_case(n, m)))
-                
-                current_nm += (n*m)
-                if current_nm >= TARGET_NM: 
-                    break
-
-        # --- WRITE INPUT ---
-        input_filename = f"input{file_id}.txt"
-        input_path = os.path.join(INPUT_DIR, input_filename)
-        
-        with open(input_path, 'w') as f:
-            f.write(f"{len(cases)}\n")
-            for n, m, matrix in cases:
-                f.write(f"{n} {m}\n")
-                for row in matrix:
-                    f.write(" ".join(map(str, row)) + "\n")
-        
-        # --- GENERATE OUTPUT ---
-        output_filename = f"output{file_id}.txt"
-        output_path = os.path.join(OUTPUT_SUBDIR, output_filename)
-        generate_output_for_file(input_path, output_path)
+                    cases.append((n, m, make_valid(n, m)))
+            
+            current_nm += (n*m)
+            if current_nm >= target_nm: 
+                break
+
+    return cases
+
+def write_input(f, cases):
+    f.write(f"{len(cases)}\n")
+    for n, m, matrix in cases:
+        f.write(f"{n} {m}\n")
+        for row in matrix:
+            f.write(format_row(row) + "\n")
+
+def generate_file(i, f_in):
+    """
+    Builds file i, writes its input to f_in and returns the output text.
+    This is the per-file hook the tools/ scripts call.
+    """
+    rng = seed_file("krish", MASTER_SEED, i)
+    cases = build_cases(i, rng)
+    write_input(f_in, cases)
+    return "\n".join(solve_fast(n, m, matrix) for n, m, matrix in cases)
+
+# ==========================================
+# OUTPUT SINKS
+# ==========================================
+
+class DirectorySink:
+    """
+    Writes members as plain files under `root` (wiped first).
+    close() then packs the tree into `zip_name`.
+    """
+    def __init__(self, root, zip_name):
+        self.root = root
+        self.zip_name = zip_name
+        if os.path.exists(root):
+            shutil.rmtree(root)
+        os.makedirs(os.path.join(root, "input"))
+        os.makedirs(os.path.join(root, "output"))
+
+    def _path(self, arcname):
+        return os.path.join(self.root, *arcname.split("/"))
+
+    def open(self, arcname):
+        return open(self._path(arcname), 'w')
+
+    def read(self, arcname):
+        with open(self._path(arcname), 'r') as f:
+            return f.read()
+
+    def close(self):
+        print("Compressing files...")
+        with zipfile.ZipFile(self.zip_name, 'w', zipfile.ZIP_DEFLATED) as zipf:
+            for root, dirs, files in os.walk(self.root):
+                for file in files:
+                    file_path = os.path.join(root, file)
+                    arcname = os.path.relpath(file_path, self.root)
+                    zipf.write(file_path, arcname)
+
+class ZipSink:
+    """
+    Streams every member straight into `zip_name` via ZipFile.open(..., 'w'),
+    compressing as rows are written. Nothing touches the disk but the archive.
+    """
+    def __init__(self, zip_name):
+        self.zip_name = zip_name
+        self.zipf = zipfile.ZipFile(zip_name, 'w', zipfile.ZIP_DEFLATED)
+
+    def open(self, arcname):
+        return io.TextIOWrapper(self.zipf.open(arcname, 'w'), encoding="utf-8")
+
+    def read(self, arcname):
+        with zipfile.ZipFile(self.zip_name, 'r') as zipf:
+            return zipf.read(arcname).decode("utf-8")
+
+    def close(self):
+        self.zipf.close()
+
+def open_sink(kind):
+    if kind == "zip":
+        return ZipSink(ZIP_NAME)
+    if kind == "dir":
+        return DirectorySink(OUTPUT_DIR, ZIP_NAME)
+    raise ValueError(f"Unknown OUTPUT_SINK: {kind!r}")
+
+# ==========================================
+# MAIN EXECUTION
+# ==========================================
+
+def main():
+    sink = open_sink(OUTPUT_SINK)
+
+    print(f"Generating {NUM_FILES} test files ({ENGINE} engine, {OUTPUT_SINK} sink)...")
+
+    for i in range(NUM_FILES):
+        file_id = f"{i:02}"
+
+        # The zip sink allows one open member at a time: input first, then output.
+        with sink.open(f"input/input{file_id}.txt") as f:
+            output_text = generate_file(i, f)
+        with sink.open(f"output/output{file_id}.txt") as f:
+            f.write(output_text)
         
         if i % 10 == 0:
             print(f"Generated case {i}...")
 
-    # --- ZIP CREATION ---
-    print("Compressing files...")
-    with zipfile.ZipFile(ZIP_NAME, 'w', zipfile.ZIP_DEFLATED) as zipf:
-        for root, dirs, files in os.walk(OUTPUT_DIR):
-            for file in files:
-                file_path = os.path.join(root, file)
-                arcname = os.path.relpath(file_path, OUTPUT_DIR)
-                zipf.write(file_path, arcname)
+    sink.close()
+
+    if VERIFY_ROUNDTRIP:
+        print("Verifying round-trip...")
+        for i in range(NUM_FILES):
+            file_id = f"{i:02}"
+            verify_output(sink.read(f"input/input{file_id}.txt"),
+                          sink.read(f"output/output{file_id}.txt"),
+                          f"input{file_id}.txt")
 
     # Check size
     zip_size = os.path.getsize(ZIP_NAME) / (1024 * 1024)
     print(f"Done! Created {ZIP_NAME} ({zip_size:.2f} MB)")
     if zip_size > 85:
-        print("WARNING: Zip size exceeds 85MB. Consider reducing TARGET_NM.")
+        print("WARNING: Zip size exceeds 85MB. Consider reducing TARGET_NM "
+              "(python -m tools.estimate krish --budget 85MB suggests values).")
     else:
         print("Zip size is within 85MB limit.")
 
@@ -1,5 +1,30 @@
 import os
 import random
+from bisect import bisect_right
+from itertools import accumulate
+
+try:
+    import numpy as np
+except ImportError:  # solve_batch falls back to per-case solve_fast
+    np = None
+
+from tools.cases import CaseBuffer
+from tools.seeding import seed_file
+
+# --- SETTINGS ---
+NUM_FILES = 100
+MASTER_SEED = 0
+
+# To allow N=10^5, we need the file limit to be at least 100,000.
+# 100 files * 100k numbers * ~7 bytes/num = ~70MB.
+# This is safely under 85MB.
+# `python -m tools.estimate lavanya --budget 85MB` re-checks this by sampling.
+SUM_N_PER_FILE = 100_000
+MAX_VAL = 10**6 
+
+# "per_case": solve_fast on every case (fastest here, see solve_batch).
+# "batch":     solve_batch, all cases of a file in one lockstep search.
+SOLVER = "per_case"
 
 def check(mid, expenses, D):
     """
@@ -37,6 +62,205 @@ def solve(n, d, expenses):
             low = mid + 1
     return ans
 
+def check_prefix(mid, prefix, D):
+    """
+    Same greedy as check(), one group at a time: each group ends at the last
+    index whose prefix sum stays within prefix[start] + mid, found by bisect.
+    O(D log N) per call, stopping as soon as more than D groups are needed.
+    Assumes mid >= max(expenses), which solve's search range guarantees.
+    """
+    n = len(prefix) - 1
+    groups = 0
+    pos = 0
+    while pos < n:
+        groups += 1
+        if groups > D:
+            return False
+        pos = bisect_right(prefix, prefix[pos] + mid, pos + 1) - 1
+    return True
+
+def search_bounds(largest, total, d):
+    """
+    A range that always holds the answer:
+      low  = max(largest, ceil(total / d)), since some group holds that much;
+      high = ceil(total / d) + largest: with this cap every closed greedy
+             group exceeds total / d, so at most d groups are needed.
+    """
+    average = -(-total // d)
+    return max(largest, average), min(total, average + largest)
+
+def solve_fast(n, d, expenses):
+    """
+    solve() with the prefix sums computed once and reused by every
+    binary-search step. Falls back to the linear check() when D is close
+    to N, where D bisects cost more than one scan.
+    The range is narrowed as in search_bounds(), which saves about a third
+    of the steps for large sums.
+    """
+    if not expenses:
+        return 0
+
+    prefix = list(accumulate(expenses, initial=0))
+    n = len(expenses)
+    if d * n.bit_length() >= n:
+        feasible = lambda mid: check(mid, expenses, d)
+    else:
+        feasible = lambda mid: check_prefix(mid, prefix, d)
+
+    low, high = search_bounds(max(expenses), prefix[-1], d)
+    ans = high
+    
+    while low <= high:
+        mid = (low + high) // 2
+        if feasible(mid):
+            ans = mid
+            high = mid - 1
+        else:
+            low = mid + 1
+    return ans
+
+def solve_batch(cases):
+    """
+    Runs the binary searches of all cases (a CaseBuffer, or (n, d, expenses)
+    tuples) in lockstep. The buffer's flat expense array and offsets are
+    used as they are, with a single global prefix sum (monotone, since
+    expenses are positive). Each round
+    checks every case's midpoint in one vectorized pass:
+      1. one searchsorted gives, for every position, where the greedy group
+         starting there ends (next_start);
+      2. pointer doubling over next_start counts each case's groups in
+         O(log max_n) gathers, independent of d.
+    The range per case is the one from search_bounds(). Same values as
+    solve().
+    Measured on files 20-99 (~400 cases, N = 10^5) this is ~1.8x slower than
+    solve_fast per case: each round costs a 10^5-key searchsorted plus the
+    jump table, ~10 ms, which is more than the interpreter overhead it saves.
+    Kept for machines where NumPy's passes are cheaper; see SOLVER.
+    """
+    if not isinstance(cases, CaseBuffer):
+        cases = CaseBuffer.from_cases(cases)
+    if np is None:
+        return [solve_fast(n, d, e) for (n, d), e in cases]
+
+    flat = cases.values_np()
+    offsets = cases.offsets_np()
+    lengths = np.diff(offsets)
+    d = np.array([header[1] for header in cases.headers], dtype=np.int64)
+    prefix = np.concatenate(([0], np.cumsum(flat)))
+    starts, ends = offsets[:-1], offsets[1:]
+    case_of = np.repeat(np.arange(len(cases)), lengths)
+    levels = int(lengths.max()).bit_length()
+
+    largest = np.maximum.reduceat(flat, starts)
+    total = prefix[ends] - prefix[starts]
+    average = -(-total // d)
+    low = np.maximum(largest, average)
+    high = np.minimum(total, average + largest)
+    ans = high.copy()
+
+    searching = low <= high
+    while searching.any():
+        mid = (low + high) // 2
+        ok = searching & (_count_groups(mid, prefix, starts, ends, case_of, levels) <= d)
+        ans = np.where(ok, mid, ans)
+        high = np.where(ok, mid - 1, high)
+        low = np.where(searching & ~ok, mid + 1, low)
+        searching = low <= high
+
+    return ans.tolist()
+
+def _count_groups(mid, prefix, starts, ends, case_of, levels):
+    """Greedy group count of every case for its own cap mid[case]."""
+    done = len(prefix) - 1 # Sink index: "past the end of the case"
+    reach = np.searchsorted(prefix, prefix[:-1] + mid[case_of], side="right") - 1
+    next_start = np.append(np.where(reach < ends[case_of], reach, done), done)
+
+    jumps = [next_start]
+    for _ in range(1, levels):
+        jumps.append(jumps[-1][jumps[-1]])
+
+    pos = starts
+    hops = np.zeros(len(starts), dtype=np.int64)
+    for level in range(levels - 1, -1, -1):
+        target = jumps[level][pos]
+        moved = target != done
+        pos = np.where(moved, target, pos)
+        hops += moved.astype(np.int64) << level
+    return hops + 1
+
+def build_cases(i):
+    """Returns the cases of file index i: a CaseBuffer of (n, d) headers and expenses."""
+    test_cases_in = CaseBuffer()
+    current_n_sum = 0
+    
+    # --- Strategy for this file ---
+    
+    # File 00-09: Manual Edge Cases (10 files)
+    if i == 0:
+        # Sample Case
+        test_cases_in.add((10, 5), [1, 2, 3, 4, 5, 6, 7, 8, 9, 10])
+    elif i == 1:
+        # N=1
+        test_cases_in.add((1, 1), [100])
+    elif i == 2:
+        # D=1 (Answer is sum)
+        test_cases_in.add((5, 1), [10, 20, 30, 40, 50])
+    elif i == 3:
+        # D=N (Answer is max element)
+        test_cases_in.add((5, 5), [10, 20, 30, 40, 50])
+    elif i == 4:
+        # Large values (Force long long for sum)
+        test_cases_in.add((3, 2), [1000000, 1000000, 1000000])
+    elif i < 10:
+        # Small randoms
+        while current_n_sum < 1000:
+            n = random.randint(1, 50)
+            d = random.randint(1, n)
+            e = (random.randint(1, 1000) for _ in range(n))
+            test_cases_in.add((n, d), e)
+            current_n_sum += n
+
+    # File 10-19: ABSOLUTE MAX CONSTRAINTS (TLE cases)
+    # 10 files, each with ONE case of N=100,000.
+    # This forces the O(N log Ans) solution. O(N^2) DP will die.
+    elif i < 20:
+        T = 1
+        n = 100_000 # The hard limit
+        d = random.randint(1, n)
+        # Generate large random expenses (straight into the buffer, no list)
+        e = (random.randint(1, MAX_VAL) for _ in range(n))
+        test_cases_in.add((n, d), e)
+
+    # File 20-99: High T, Small N (Random stress test)
+    else:
+        while current_n_sum < SUM_N_PER_FILE - 100:
+            n = random.randint(1, 500)
+            d = random.randint(1, n)
+            e = (random.randint(1, MAX_VAL) for _ in range(n))
+            test_cases_in.add((n, d), e)
+            current_n_sum += n
+
+    return test_cases_in
+
+def generate_file(i, f_in):
+    """
+    Writes the input of file i to f_in and returns the output text.
+    This is the per-file hook the tools/ scripts call.
+    """
+    seed_file("lavanya", MASTER_SEED, i)
+    test_cases_in = build_cases(i)
+    f_in.write(f"{len(test_cases_in)}\n") # Write T
+    
+    for k in range(len(test_cases_in)):
+        test_cases_in.write_case(f_in, k) # "n d", then the expenses
+        
+    if SOLVER == "batch":
+        answers = solve_batch(test_cases_in)
+    else:
+        # One case at a time, reading the buffer's array('q') slice directly
+        answers = [solve_fast(n, d, e) for (n, d), e in test_cases_in]
+    return "".join(f"{answer}\n" for answer in answers)
+
 def generate_test_cases():
     base_dir = "lavanya_test_cases"
     input_dir = os.path.join(base_dir, "input")
@@ -45,82 +269,16 @@ def generate_test_cases():
     os.makedirs(input_dir, exist_ok=True)
     os.makedirs(output_dir, exist_ok=True)
 
-    # --- SETTINGS ---
-    NUM_FILES = 100
-    
-    # To allow N=10^5, we need the file limit to be at least 100,000.
-    # 100 files * 100k numbers * ~7 bytes/num = ~70MB.
-    # This is safely under 85MB.
-    SUM_N_PER_FILE = 100_000
-    MAX_VAL = 10**6 
-    
     print(f"🚀 Generating {NUM_FILES} test files (under 85MB) for Lavanya...")
 
     for i in range(NUM_FILES):
         input_path = os.path.join(input_dir, f"input{i:02d}.txt")
         output_path = os.path.join(output_dir, f"output{i:02d}.txt")
         
-        test_cases_in = []
-        current_n_sum = 0
-        
-        # --- Strategy for this file ---
-        
-        # File 00-09: Manual Edge Cases (10 files)
-        if i == 0:
-            # Sample Case
-            test_cases_in.append((10, 5, [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]))
-        elif i == 1:
-            # N=1
-            test_cases_in.append((1, 1, [100]))
-        elif i == 2:
-            # D=1 (Answer is sum)
-            test_cases_in.append((5, 1, [10, 20, 30, 40, 50]))
-        elif i == 3:
-            # D=N (Answer is max element)
-            test_cases_in.append((5, 5, [10, 20, 30, 40, 50]))
-        elif i == 4:
-            # Large values (Force long long for sum)
-            test_cases_in.append((3, 2, [1000000, 1000000, 1000000]))
-        elif i < 10:
-            # Small randoms
-            while current_n_sum < 1000:
-                n = random.randint(1, 50)
-                d = random.randint(1, n)
-                e = [random.randint(1, 1000) for _ in range(n)]
-                test_cases_in.append((n, d, e))
-                current_n_sum += n
-
-        # File 10-19: ABSOLUTE MAX CONSTRAINTS (TLE cases)
-        # 10 files, each with ONE case of N=100,000.
-        # This forces the O(N log Ans) solution. O(N^2) DP will die.
-        elif i < 20:
-            T = 1
-            n = 100_000 # The hard limit
-            d = random.randint(1, n)
-            # Generate large random expenses
-            e = [random.randint(1, MAX_VAL) for _ in range(n)]
-            test_cases_in.append((n, d, e))
-
-        # File 20-99: High T, Small N (Random stress test)
-        else:
-            while current_n_sum < SUM_N_PER_FILE - 100:
-                n = random.randint(1, 500)
-                d = random.randint(1, n)
-                e = [random.randint(1, MAX_VAL) for _ in range(n)]
-                test_cases_in.append((n, d, e))
-                current_n_sum += n
-
-        # --- Write files ---
-        with open(input_path, 'w') as f_in, open(output_path, 'w') as f_out:
-            f_in.write(f"{len(test_cases_in)}\n") # Write T
-            
-            for (n, d, e) in test_cases_in:
-                f_in.write(f"{n} {d}\n")
-                f_in.write(" ".join(map(str, e)) + "\n")
-                
-                # Solve and write the answer
-                answer = solve(n, d, e)
-                f_out.write(f"{answer}\n")
+        with open(input_path, 'w') as f_in:
+            output_text = generate_file(i, f_in)
+        with open(output_path, 'w') as f_out:
+            f_out.write(output_text)
                 
     print(f"✅ Generated {NUM_FILES} files in '{base_dir}/'.")
     print("⚠️  Total zip size should be safely under 85MB.")
@@ -1,16 +1,149 @@
 import os
 import random
+from functools import lru_cache
+from math import gcd
+
+try:
+    import numpy as np
+except ImportError:  # answer_lines falls back to the memoized answer_line
+    np = None
+
+from tools.seeding import seed_file
+
+# SETTINGS
+NUM_FILES = 100          # Change to 100 if you really want to make them cry
+MASTER_SEED = 0
+MAX_T = 100000          # 10^5 test cases per file
+MAX_C = 10000000        # 10^7 max value
+MAX_AB = 10**17         # Bound on a and b
+
+def solve(c):
+    """
+    Closed form. With k = bit length of c (so 2^k > c) take
+        a = c * (2^k + 1) = (c << k) | c,   b = c << k.
+    c divides both, so lcm(a, c) = a and lcm(b, c) = b, and since
+    x ^ c = x + c - 2 (x & c) the equation becomes (a & c) + (b & c) = c,
+    which holds with a & c = c and b & c = 0.
+    For c <= 10^7, a <= 10^7 * (2^24 + 1) < 1.7 * 10^14, well under 10^17.
+    """
+    k = c.bit_length()
+    return c * ((1 << k) + 1), c << k
+
+def check(c, a, b):
+    """Same test as custom_checker.cpp: bounds, then (a^c)+(b^c) == lcm(a,c)+lcm(b,c)."""
+    if not (1 <= a <= MAX_AB and 1 <= b <= MAX_AB):
+        return False
+    return (a ^ c) + (b ^ c) == a * c // gcd(a, c) + b * c // gcd(b, c)
+
+@lru_cache(maxsize=None)
+def answer_line(c):
+    """"a b" for one c, memoized: files 40-99 are 10^5 copies of MAX_C."""
+    a, b = solve(c)
+    return f"{a} {b}"
+
+def answer_lines(c_values):
+    """
+    Output text for a whole file. With NumPy the answers are computed as
+    arrays once per distinct c (np.unique) and spread back by the inverse
+    index; otherwise answer_line's cache does the deduplication.
+    """
+    if np is None:
+        return "\n".join(answer_line(c) for c in c_values) + "\n"
+
+    distinct, inverse = np.unique(np.asarray(c_values, dtype=np.int64), return_inverse=True)
+    k = np.frexp(distinct.astype(np.float64))[1] # Bit length, exact below 2^53
+    b = distinct << k
+    a = b + distinct
+    lines = np.array([f"{x} {y}" for x, y in zip(a.tolist(), b.tolist())], dtype=object)
+    return "\n".join(lines[inverse].tolist()) + "\n"
+
+def build_values(i):
+    """Returns the list of c queries for file index i."""
+    c_values = []
+
+    # --- STRATEGY ---
+    
+    # File 00-04: EDGE CASE HELL (Small numbers, Powers of 2, Primes)
+    if i < 5:
+        # Mix of small numbers, powers of 2, and randoms
+        c_values.extend([1, 2, 3, 4, 5, 6, 7, 8, 9, 10])
+        
+        # Powers of 2 up to Max
+        val = 1
+        while val <= MAX_C:
+            c_values.append(val)
+            val *= 2
+        
+        # Mersenne (Power of 2 - 1)
+        val = 2
+        while val <= MAX_C:
+            c_values.append(val - 1)
+            val *= 2
+            
+        # Fill the rest with Randoms
+        remaining = MAX_T - len(c_values)
+        c_values.extend([random.randint(1, MAX_C) for _ in range(remaining)])
+
+    # File 05-09: BITWISE TRICKERY (Sparse and Dense bits)
+    elif i < 10:
+        # Numbers like 1111100000, 1010101010, etc.
+        # To check if their bit manipulation logic holds up
+        for _ in range(MAX_T):
+            # 50% chance of random, 50% chance of specific bit pattern
+            if random.random() > 0.5:
+                c_values.append(random.randint(1, MAX_C))
+            else:
+                # Create weird numbers
+                mask = random.getrandbits(24) # 2^24 covers 10^7 range
+                mask = mask % MAX_C
+                if mask == 0: mask = 1
+                c_values.append(mask)
+
+    # File 10-39: PURE CHAOS (Uniform Random Max Constraints)
+    elif i < 40:
+        # Just 100,000 random numbers up to 10^7
+        # This stresses I/O the most
+        c_values = [random.randint(1, MAX_C) for _ in range(MAX_T)]
+
+    # File 40-49: THE WALL (Every value is MAX_C)
+    else:
+        # Checking if they handle the largest number repeatedly without caching issues
+        # or overflow errors in calculation.
+        c_values = [MAX_C] * MAX_T # All values are 10,000,000
+
+    return c_values
+
+@lru_cache(maxsize=None)
+def render_wall(max_t, max_c):
+    """(input text, output text) of a WALL file. Files 40-99 are identical, so this renders once."""
+    c_values = [max_c] * max_t
+    return f"{len(c_values)}\n" + '\n'.join(map(str, c_values)), answer_lines(c_values)
+
+def generate_file(i, f_in):
+    """
+    Writes the input of file i to f_in and returns the output text
+    (one "a b" pair per query, see solve).
+    This is the per-file hook the tools/ scripts call.
+    """
+    if i >= 40:
+        input_text, output_text = render_wall(MAX_T, MAX_C)
+        f_in.write(input_text)
+        return output_text
+
+    seed_file("ranjan", MASTER_SEED, i)
+    c_values = build_values(i)
+    # Header: Number of Test Cases in this file
+    f_in.write(f"{len(c_values)}\n")
+    # Join them for faster write than loop
+    f_in.write('\n'.join(map(str, c_values)))
+    
+    return answer_lines(c_values)
 
 def generate_nuclear_tests():
     base_dir = "ranjan_nuclear_tests"
     if not os.path.exists(base_dir):
         os.makedirs(base_dir)
 
-    # SETTINGS
-    NUM_FILES = 100          # Change to 100 if you really want to make them cry
-    MAX_T = 100000          # 10^5 test cases per file
-    MAX_C = 10000000        # 10^7 max value
-
     print(f"☢️  Generating {NUM_FILES} FILES with {MAX_T} queries each...")
     print(f"🔥  Total Queries: {NUM_FILES * MAX_T}...")
 
@@ -20,69 +153,13 @@ def generate_nuclear_tests():
         
         path_in = os.path.join(base_dir, filename_in)
         path_out = os.path.join(base_dir, filename_out)
-        
-        c_values = []
-
-        # --- STRATEGY ---
-        
-        # File 00-04: EDGE CASE HELL (Small numbers, Powers of 2, Primes)
-        if i < 5:
-            # Mix of small numbers, powers of 2, and randoms
-            c_values.extend([1, 2, 3, 4, 5, 6, 7, 8, 9, 10])
-            
-            # Powers of 2 up to Max
-            val = 1
-            while val <= MAX_C:
-                c_values.append(val)
-                val *= 2
-            
-            # Mersenne (Power of 2 - 1)
-            val = 2
-            while val <= MAX_C:
-                c_values.append(val - 1)
-                val *= 2
-                
-            # Fill the rest with Randoms
-            remaining = MAX_T - len(c_values)
-            c_values.extend([random.randint(1, MAX_C) for _ in range(remaining)])
-
-        # File 05-09: BITWISE TRICKERY (Sparse and Dense bits)
-        elif i < 10:
-            # Numbers like 1111100000, 1010101010, etc.
-            # To check if their bit manipulation logic holds up
-            for _ in range(MAX_T):
-                # 50% chance of random, 50% chance of specific bit pattern
-                if random.random() > 0.5:
-                    c_values.append(random.randint(1, MAX_C))
-                else:
-                    # Create weird numbers
-                    mask = random.getrandbits(24) # 2^24 covers 10^7 range
-                    mask = mask % MAX_C
-                    if mask == 0: mask = 1
-                    c_values.append(mask)
-
-        # File 10-39: PURE CHAOS (Uniform Random Max Constraints)
-        elif i < 40:
-            # Just 100,000 random numbers up to 10^7
-            # This stresses I/O the most
-            c_values = [random.randint(1, MAX_C) for _ in range(MAX_T)]
-
-        # File 40-49: THE WALL (Every value is MAX_C)
-        else:
-            # Checking if they handle the largest number repeatedly without caching issues
-            # or overflow errors in calculation.
-            c_values = [MAX_C] * MAX_T # All values are 10,000,000
 
         # --- WRITE TO FILE ---
         with open(path_in, 'w') as f:
-            # Header: Number of Test Cases in this file
-            f.write(f"{len(c_values)}\n")
-            # Join them for faster write than loop
-            f.write('\n'.join(map(str, c_values)))
+            output_text = generate_file(i, f)
         
-        # Dummy Output
         with open(path_out, 'w') as f:
-            f.write("0")
+            f.write(output_text)
 
     print(f"✅ Done! Folder '{base_dir}' is ready.")
     print("👉 Pro Tip: Select all files inside -> Right Click -> Compress/Zip -> Upload Zip to HackerRank.")
@@ -0,0 +1,64 @@
+"""
+Array solver shared by romanch/testcases.py, tle_cases/tlecases.py and
+one_more/killer.py.
+
+After sorting, an even n must pair neighbours (0,1), (2,3), ...; an odd n
+may drop one element first. Dropping an odd index k is never better than
+dropping k+1 (the pair (k-1, k+1) is wider than (k-1, k)), so only even
+k = 2m matter: left of it sit the pairs (2j, 2j+1), right of it the pairs
+(2j+1, 2j+2). A prefix "all left pairs fit" flag and a suffix "all right
+pairs fit" flag check every m at once. This is exactly the answer of the
+reference greedy, which drops the left element of the first bad pair.
+"""
+try:
+    import numpy as np
+except ImportError:  # solve_pairs falls back to plain Python below
+    np = None
+
+
+def pairs_fit(sorted_a, d):
+    """YES/NO for an already sorted int64 array."""
+    fits = np.diff(sorted_a) <= d # fits[j]: a[j] and a[j+1] may be paired
+    if len(sorted_a) % 2 == 0:
+        return "YES" if fits[0::2].all() else "NO"
+
+    # Drop index 2m: needs left[:m] and right[m:] to fit, m = 0 .. (n-1)/2
+    left, right = fits[0::2], fits[1::2]
+    prefix = np.concatenate(([True], np.logical_and.accumulate(left)))
+    suffix = np.concatenate((np.logical_and.accumulate(right[::-1])[::-1], [True]))
+    return "YES" if (prefix & suffix).any() else "NO"
+
+
+def solve_pairs(n, d, a, presorted=False):
+    """
+    Answer for one case; `a` is a list or array and is never modified.
+    presorted=True skips the sort for arrays built in order (sorted_uniform).
+    """
+    if np is not None:
+        a = np.asarray(a, dtype=np.int64)
+        return pairs_fit(a if presorted else np.sort(a), d)
+
+    a = sorted(a)
+    skipped = n % 2 == 0 # Even n has no element to drop
+    i = 1
+    while i < n:
+        if a[i] - a[i-1] <= d:
+            i += 2
+        elif not skipped:
+            skipped = True
+            i += 1
+        else:
+            return "NO"
+    return "YES"
+
+
+def sorted_uniform(rng, n, low, high):
+    """
+    n values drawn uniformly from [low, high], returned already sorted.
+    The normalised cumulative sums of n+1 exponential gaps are distributed
+    as n sorted uniforms in (0, 1), so no sort is needed.
+    """
+    gaps = rng.exponential(size=n + 1)
+    u = np.cumsum(gaps[:-1]) / gaps.sum()
+    values = low + (u * (high - low + 1)).astype(np.int64)
+    return np.minimum(values, high) # u may round up to 1.0
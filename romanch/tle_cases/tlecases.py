@@ -1,5 +1,23 @@
 import os
 import random
+import sys
+
+# The shared array solver lives one level up, in romanch/pairing_solver.py
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from pairing_solver import np, solve_pairs, sorted_uniform
+
+from tools.seeding import seed_file
+
+# --- SETTINGS ---
+NUM_FILES = 5
+MASTER_SEED = 0
+MAX_VAL = 1_000_000_000 # 10^9
+MAX_N_SUM = 100_000     # 10^5
+
+# "numpy": arrays are built already sorted (sorted_uniform), solved with
+#          solve_pairs and only shuffled when written.
+# "list":  random.randint lists, solved with solve() on a copy.
+ENGINE = "numpy" if np else "list"
 
 # --- YOUR SOLUTION LOGIC (Do not change this to ensure outputs match your logic) ---
 def solve(n, d, a):
@@ -25,6 +43,110 @@ def solve(n, d, a):
         return "YES"
 
 # --- TEST CASE GENERATOR ---
+def random_values(n, rng):
+    """n values in [1, MAX_VAL]: a sorted array (numpy engine) or a plain list."""
+    if rng is not None:
+        return sorted_uniform(rng, n, 1, MAX_VAL)
+    return [random.randint(1, MAX_VAL) for _ in range(n)]
+
+def build_cases(i, rng=None):
+    """Returns the (n, d, a) cases for file index i; rng feeds the numpy engine."""
+    if ENGINE != "numpy":
+        rng = None
+    elif rng is None:
+        rng = np.random.default_rng()
+    test_cases = []
+    
+    # --- FILE 00: The "Monolith" Even Case ---
+    # One single test case with N=100,000 (Even)
+    # d is reasonably small to force strict checking
+    if i == 0:
+        t = 1
+        n = 100_000
+        d = random.randint(50, 5000)
+        a = random_values(n, rng)
+        test_cases.append((n, d, a))
+
+    # --- FILE 01: The "Monolith" Odd Case ---
+    # One single test case with N=99,999 (Odd)
+    # Uses the skip logic heavily
+    elif i == 1:
+        t = 1
+        n = 99_999
+        d = random.randint(100, 10000)
+        a = random_values(n, rng)
+        test_cases.append((n, d, a))
+
+    # --- FILE 02: The "Split" Even Case ---
+    # 5 test cases, each N=20,000. Total = 100,000
+    # High d (Expect mostly YES)
+    elif i == 2:
+        t = 5
+        chunk_n = 20_000
+        for _ in range(t):
+            d = random.randint(MAX_VAL // 2, MAX_VAL) # Very high d
+            a = random_values(chunk_n, rng)
+            test_cases.append((chunk_n, d, a))
+
+    # --- FILE 03: The "Split" Odd Case ---
+    # 5 test cases, each N=19,999. Total approx 100,000
+    # Low d (Expect mostly NO)
+    elif i == 3:
+        t = 5
+        chunk_n = 19_999
+        for _ in range(t):
+            d = random.randint(0, 100) # Very low d
+            a = random_values(chunk_n, rng)
+            test_cases.append((chunk_n, d, a))
+
+    # --- FILE 04: The "Chaos" Mix ---
+    # Many small-ish test cases summing exactly to 100,000
+    # Random Even and Odd N
+    elif i == 4:
+        current_sum = 0
+        while current_sum < MAX_N_SUM:
+            # Generate random N between 100 and 5000
+            rem = MAX_N_SUM - current_sum
+            if rem < 5000:
+                n = rem # Take strictly remainder
+            else:
+                n = random.randint(100, 5000)
+            
+            if n == 0: break
+            
+            d = random.randint(0, MAX_VAL)
+            a = random_values(n, rng)
+            test_cases.append((n, d, a))
+            current_sum += n
+
+    return test_cases
+
+def generate_file(i, f_in):
+    """
+    Writes the input of file i to f_in and returns the output text.
+    This is the per-file hook the tools/ scripts call.
+    """
+    rng = seed_file("romanch_tle", MASTER_SEED, i)
+    test_cases = build_cases(i, rng)
+    # First line is T
+    f_in.write(f"{len(test_cases)}\n")
+    
+    answers = []
+    for (n, d, a) in test_cases:
+        # Write Input
+        f_in.write(f"{n} {d}\n")
+        if ENGINE == "numpy":
+            # Pre-sorted array: answer it as is, shuffle only the written copy
+            f_in.write(" ".join(map(str, rng.permutation(a).tolist())) + "\n")
+            answers.append(f"{solve_pairs(n, d, a, presorted=True)}\n")
+            continue
+        f_in.write(" ".join(map(str, a)) + "\n")
+        
+        # Generate Output using YOUR logic
+        # Passing a copy of list(a) because your solve() sorts in-place
+        answers.append(f"{solve(n, d, list(a))}\n")
+    return "".join(answers)
+
 def generate_max_constraints_cases():
     base_dir = "romanch_max_constraints"
     input_dir = os.path.join(base_dir, "input")
@@ -34,95 +156,19 @@ def generate_max_constraints_cases():
     os.makedirs(input_dir, exist_ok=True)
     os.makedirs(output_dir, exist_ok=True)
 
-    print(f"🚀 Generating 5 MAXIMUM constraint test files in '{base_dir}'...")
+    print(f"🚀 Generating {NUM_FILES} MAXIMUM constraint test files in '{base_dir}'...")
     print(f"ℹ️  Each file will have Sum of N = 100,000 to check for TLE.")
 
-    MAX_VAL = 1_000_000_000 # 10^9
-    MAX_N_SUM = 100_000     # 10^5
-
     # We will generate exactly 5 files
-    for file_idx in range(5):
+    for file_idx in range(NUM_FILES):
         input_path = os.path.join(input_dir, f"input{file_idx:02d}.txt")
         output_path = os.path.join(output_dir, f"output{file_idx:02d}.txt")
         
-        test_cases = []
-        
-        # --- FILE 00: The "Monolith" Even Case ---
-        # One single test case with N=100,000 (Even)
-        # d is reasonably small to force strict checking
-        if file_idx == 0:
-            t = 1
-            n = 100_000
-            d = random.randint(50, 5000)
-            a = [random.randint(1, MAX_VAL) for _ in range(n)]
-            test_cases.append((n, d, a))
-
-        # --- FILE 01: The "Monolith" Odd Case ---
-        # One single test case with N=99,999 (Odd)
-        # Uses the skip logic heavily
-        elif file_idx == 1:
-            t = 1
-            n = 99_999
-            d = random.randint(100, 10000)
-            a = [random.randint(1, MAX_VAL) for _ in range(n)]
-            test_cases.append((n, d, a))
-
-        # --- FILE 02: The "Split" Even Case ---
-        # 5 test cases, each N=20,000. Total = 100,000
-        # High d (Expect mostly YES)
-        elif file_idx == 2:
-            t = 5
-            chunk_n = 20_000
-            for _ in range(t):
-                d = random.randint(MAX_VAL // 2, MAX_VAL) # Very high d
-                a = [random.randint(1, MAX_VAL) for _ in range(chunk_n)]
-                test_cases.append((chunk_n, d, a))
-
-        # --- FILE 03: The "Split" Odd Case ---
-        # 5 test cases, each N=19,999. Total approx 100,000
-        # Low d (Expect mostly NO)
-        elif file_idx == 3:
-            t = 5
-            chunk_n = 19_999
-            for _ in range(t):
-                d = random.randint(0, 100) # Very low d
-                a = [random.randint(1, MAX_VAL) for _ in range(chunk_n)]
-                test_cases.append((chunk_n, d, a))
-
-        # --- FILE 04: The "Chaos" Mix ---
-        # Many small-ish test cases summing exactly to 100,000
-        # Random Even and Odd N
-        elif file_idx == 4:
-            current_sum = 0
-            while current_sum < MAX_N_SUM:
-                # Generate random N between 100 and 5000
-                rem = MAX_N_SUM - current_sum
-                if rem < 5000:
-                    n = rem # Take strictly remainder
-                else:
-                    n = random.randint(100, 5000)
-                
-                if n == 0: break
-                
-                d = random.randint(0, MAX_VAL)
-                a = [random.randint(1, MAX_VAL) for _ in range(n)]
-                test_cases.append((n, d, a))
-                current_sum += n
-
         # --- WRITE TO FILES ---
-        with open(input_path, 'w') as f_in, open(output_path, 'w') as f_out:
-            # First line is T
-            f_in.write(f"{len(test_cases)}\n")
-            
-            for (n, d, a) in test_cases:
-                # Write Input
-                f_in.write(f"{n} {d}\n")
-                f_in.write(" ".join(map(str, a)) + "\n")
-                
-                # Generate Output using YOUR logic
-                # Passing a copy of list(a) because your solve() sorts in-place
-                ans = solve(n, d, list(a))
-                f_out.write(f"{ans}\n")
+        with open(input_path, 'w') as f_in:
+            output_text = generate_file(file_idx, f_in)
+        with open(output_path, 'w') as f_out:
+            f_out.write(output_text)
 
     print("✅ Done!")
     print("1. Go into 'romanch_max_constraints' folder.")
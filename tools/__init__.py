@@ -0,0 +1,7 @@
+"""
+Shared tooling for the generator scripts in this repo.
+
+Each generator stays a standalone script; the modules here load it by path
+(see suites.py) and drive it through its `generate_file(i, f_in)` hook.
+Run them from the repo root, e.g. `python -m tools.estimate krish`.
+"""
@@ -0,0 +1,230 @@
+"""
+Phase benchmark for every generator suite.
+
+Each file is generated through the script's generate_file() hook with its
+case builders and solvers wrapped in timers (tools/instrument.py), so the
+time splits into:
+
+    construct  seeding and building the cases (build_cases, pattern_*, ...)
+    solve      answering them (solve_fast, solve_pairs, answer_lines, ...)
+    serialize  the rest of generate_file: formatting the text / bytes
+    write      writing input and output to disk
+    zip        deflating both into a zip archive
+
+Sizes come from the scripts' own settings: --scale multiplies every size
+knob (tools/suites.py), --max raises capped knobs to their problem limit,
+and --per-strategy / --files pick which files run. A quick run and a full
+max-constraint run are the same harness:
+
+    python -m tools.bench --per-strategy 1 --scale 0.1
+    python -m tools.bench krish romanch_tle --max --json max.json
+    python -m tools.bench --per-strategy 1 --compare benchmarks/previous.json
+
+Results are saved as JSON (default benchmarks/<UTC time>.json at the repo
+root) so runs can be compared with --compare.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import tempfile
+import time
+import zipfile
+
+from tools.estimate import scaled_knobs
+from tools.generate import parse_files
+from tools.instrument import HOOKS, PhaseClock
+from tools.suites import REPO_ROOT, SUITES, get_suite, load_generator
+
+MB = 1024 * 1024
+PHASES = ("construct", "solve", "serialize", "write", "zip")
+CASE_PHASES = ("construct", "solve")  # Reported in cases/s; the others in MB/s
+
+
+class BufferWriter:
+    """In-memory f_in for generate_file; text is encoded as UTF-8."""
+
+    def __init__(self):
+        self.buffer = io.BytesIO()
+
+    def write(self, data):
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        return self.buffer.write(data)
+
+
+def count_cases(input_bytes, counted):
+    if not counted:
+        return 1
+    return int(input_bytes.split(None, 1)[0])
+
+
+def bench_suite(suite, module, files, workdir, fsync):
+    """Runs the chosen files; returns {files, cases, bytes, zip_bytes, seconds: {phase: s}}."""
+    hooks = HOOKS[suite.name]
+    clock = PhaseClock()
+    clock.install(module, hooks)
+    cases = total_bytes = 0
+    zip_path = os.path.join(workdir, f"{suite.name}.zip")
+
+    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for i in files:
+            f_in = BufferWriter()
+            before = clock.seconds["construct"] + clock.seconds["solve"]
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                output_text = module.generate_file(i, f_in)
+            elapsed = time.perf_counter() - start
+            after = clock.seconds["construct"] + clock.seconds["solve"]
+            clock.seconds["serialize"] += elapsed - (after - before)
+
+            members = {suite.input_name.format(i=i): f_in.buffer.getvalue(),
+                       suite.output_name.format(i=i): output_text.encode("utf-8")}
+            cases += count_cases(members[suite.input_name.format(i=i)], hooks.counted)
+
+            start = time.perf_counter()
+            for name, data in members.items():
+                path = os.path.join(workdir, suite.name, name)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path, 'wb') as f:
+                    f.write(data)
+                    if fsync:
+                        f.flush()
+                        os.fsync(f.fileno())
+                total_bytes += len(data)
+            clock.seconds["write"] += time.perf_counter() - start
+
+            start = time.perf_counter()
+            for name, data in members.items():
+                archive.writestr(name, data)
+            clock.seconds["zip"] += time.perf_counter() - start
+
+    return {
+        "files": len(files),
+        "cases": cases,
+        "bytes": total_bytes,
+        "zip_bytes": os.path.getsize(zip_path),
+        "seconds": {phase: clock.seconds[phase] for phase in PHASES},
+    }
+
+
+def rates(result):
+    """{phase: cases/s or MB/s} of one suite result."""
+    out = {}
+    for phase in PHASES:
+        seconds = result["seconds"][phase]
+        amount = result["cases"] if phase in CASE_PHASES else result["bytes"] / MB
+        out[phase] = amount / seconds if seconds > 0 else None
+    return out
+
+
+def format_rate(phase, rate):
+    if rate is None:
+        return "-"
+    return f"{rate:,.0f} cases/s" if phase in CASE_PHASES else f"{rate:,.1f} MB/s"
+
+
+def report(name, result, previous=None):
+    total = sum(result["seconds"].values())
+    print(f"{name}: {result['files']} files, {result['cases']:,} cases, "
+          f"{result['bytes'] / MB:.2f} MB ({result['zip_bytes'] / MB:.2f} MB zipped) in {total:.2f}s")
+    header = f"  {'phase':<10}{'seconds':>9}{'share':>7}{'rate':>20}"
+    print(header + (f"{'vs previous':>14}" if previous else ""))
+    current = rates(result)
+    before = rates(previous) if previous else {}
+    for phase in PHASES:
+        seconds = result["seconds"][phase]
+        share = seconds / total if total else 0.0
+        line = f"  {phase:<10}{seconds:>9.3f}{share:>7.0%}{format_rate(phase, current[phase]):>20}"
+        if previous:
+            old, new = before[phase], current[phase]
+            line += f"{new / old:>13.2f}x" if old and new else f"{'-':>14}"
+        print(line)
+    print()
+
+
+def apply_sizes(suite, module, scale, use_max):
+    """Rescales the suite's knobs; returns the values used (for the JSON)."""
+    base = {knob: getattr(module, knob) for knob in suite.knobs}
+    values = scaled_knobs(suite, module, base, scale) if scale != 1.0 else dict(base)
+    if use_max:
+        for knob, cap in suite.caps.items():
+            values[knob] = getattr(module, cap)
+    for knob, value in values.items():
+        setattr(module, knob, value)
+    return values
+
+
+def pick_files(suite, num_files, files_arg, per_strategy):
+    files = parse_files(files_arg, num_files)
+    if per_strategy is None:
+        return files
+    picked = []
+    for strategy in suite.strategies:
+        picked += [i for i in strategy.files if i in files][:per_strategy]
+    return picked
+
+
+def default_json_path():
+    stamp = time.strftime("%Y%m%d-%H%M%S", time.gmtime())
+    return os.path.join(REPO_ROOT, "benchmarks", f"{stamp}.json")
+
+
+def environment():
+    try:
+        import numpy
+        numpy_version = numpy.__version__
+    except ImportError:
+        numpy_version = None
+    return {"python": platform.python_version(), "numpy": numpy_version,
+            "machine": platform.machine(), "cpus": os.cpu_count()}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("suites", nargs="*", metavar="suite",
+                        help=f"any of {', '.join(sorted(SUITES))} (default: all)")
+    parser.add_argument("--files", help="file indices to run, e.g. 95-99 or 0-9,50 (default: all)")
+    parser.add_argument("--per-strategy", type=int, help="run only the first K files of each strategy")
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply every size knob by this")
+    parser.add_argument("--max", action="store_true", help="raise capped knobs to the problem limit")
+    parser.add_argument("--fsync", action="store_true", help="include fsync in the write phase")
+    parser.add_argument("--json", help="where to save the results (default: benchmarks/<time>.json)")
+    parser.add_argument("--compare", help="earlier results JSON to print speedups against")
+    args = parser.parse_args(argv)
+    for name in args.suites:
+        get_suite(name)
+
+    previous = {}
+    if args.compare:
+        with open(args.compare) as f:
+            previous = json.load(f)["suites"]
+
+    results = {}
+    for name in args.suites or list(SUITES):
+        suite = SUITES[name]
+        module = load_generator(suite)
+        knobs = apply_sizes(suite, module, args.scale, args.max)
+        files = pick_files(suite, module.NUM_FILES, args.files, args.per_strategy)
+        with tempfile.TemporaryDirectory(prefix=f"bench-{name}-") as workdir:
+            result = bench_suite(suite, module, files, workdir, args.fsync)
+        result["knobs"] = knobs
+        result["file_indices"] = files
+        results[name] = result
+        report(name, result, previous.get(name))
+
+    path = args.json or default_json_path()
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump({"time": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                   "environment": environment(),
+                   "settings": {"scale": args.scale, "max": args.max, "fsync": args.fsync,
+                                "files": args.files, "per_strategy": args.per_strategy},
+                   "suites": results}, f, indent=1)
+    print(f"💾 Results saved to {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Compact case storage shared by the generator scripts.
+
+A CaseBuffer holds all T cases of a file in flat arrays:
+
+    values   one array('q') with every case's numbers, back to back
+    offsets  where each case starts in values (T + 1 entries)
+    headers  each case's first input line as a tuple, e.g. (n, d) or (n,)
+    widths   numbers per written row: the grid width, or 0 for one line
+
+so a file keeps 8 bytes per number instead of a list slot plus a boxed
+int (~36 bytes). Values are appended straight from a generator, without
+an intermediate list. Writers and solvers read the flat arrays directly:
+write_case() formats from array slices, and values_np() / grid() give
+NumPy solvers zero-copy views.
+
+A case too big to hold can be added as a stream instead (add_stream): only
+its row source is kept, and its rows are drawn when the case is written.
+write_case() hands each row to an `on_row` callback on the way, so the case
+can be solved as it goes by (aryan's DiagonalStream). A streamed case has
+no stored values and is read once.
+
+    cases = CaseBuffer()
+    cases.add((n, d), (random.randint(1, MAX_VAL) for _ in range(n)))
+    for k in range(len(cases)):
+        cases.write_case(f_in, k)
+"""
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # Views fall back to array slices
+    np = None
+
+
+class CaseBuffer:
+    def __init__(self):
+        self.values = array('q')
+        self.offsets = array('q', [0])
+        self.headers = []
+        self.widths = array('q')
+        self.streams = {}  # Case index -> row source of a streamed case
+
+    def add(self, header, values, width=0):
+        """Appends one case: header tuple, any iterable of ints, row width (0 = one line)."""
+        self.values.extend(values)
+        self.offsets.append(len(self.values))
+        self.headers.append(tuple(header))
+        self.widths.append(width)
+
+    def add_grid(self, header, rows):
+        """Appends a case given as rows (lists, arrays or a row generator) of equal width."""
+        width = 0
+        for row in rows:
+            width = len(row)
+            self.values.extend(row)
+        self.offsets.append(len(self.values))
+        self.headers.append(tuple(header))
+        self.widths.append(width)
+
+    def add_stream(self, header, rows):
+        """Appends a case whose rows (a sized iterable of equal-width rows) are drawn only when written."""
+        self.streams[len(self.headers)] = rows
+        self.offsets.append(len(self.values))
+        self.headers.append(tuple(header))
+        self.widths.append(len(rows))
+
+    def is_streamed(self, k):
+        return k in self.streams
+
+    @classmethod
+    def from_cases(cls, cases):
+        """(n, d, values) tuples as used by the reference solvers -> CaseBuffer."""
+        buffer = cls()
+        for *header, values in cases:
+            buffer.add(header, values)
+        return buffer
+
+    def __len__(self):
+        return len(self.headers)
+
+    def case(self, k):
+        """(header, values of case k as an array('q') slice)."""
+        return self.headers[k], self.values[self.offsets[k]:self.offsets[k + 1]]
+
+    def __iter__(self):
+        for k in range(len(self)):
+            yield self.case(k)
+
+    def rows(self, k):
+        """Rows of case k as array('q') slices (one row if it has no width); a streamed case's rows as drawn."""
+        if k in self.streams:
+            yield from self.streams.pop(k)  # Read once: the rows are not kept
+            return
+        start, end = self.offsets[k], self.offsets[k + 1]
+        if start == end:
+            yield self.values[start:end] # An empty case still writes its (empty) line
+            return
+        width = self.widths[k] or end - start
+        for row_start in range(start, end, width):
+            yield self.values[row_start:row_start + width]
+
+    def values_np(self):
+        """Zero-copy int64 view of all values. add() raises BufferError while a view is alive."""
+        return np.frombuffer(self.values, dtype=np.int64)
+
+    def offsets_np(self):
+        return np.frombuffer(self.offsets, dtype=np.int64)
+
+    def grid(self, k):
+        """Case k as a 2-D (rows x width) NumPy view, or a list of row slices without NumPy."""
+        if np is None:
+            return list(self.rows(k))
+        start, end = self.offsets[k], self.offsets[k + 1]
+        width = self.widths[k] or max(1, end - start)
+        return self.values_np()[start:end].reshape(-1, width)
+
+    def write_case(self, f, k, on_row=None):
+        """Writes case k as its header line, then its rows, space separated; on_row(row) sees each row."""
+        f.write(" ".join(map(str, self.headers[k])) + "\n")
+        for row in self.rows(k):
+            f.write(" ".join(map(str, row)) + "\n")
+            if on_row is not None:
+                on_row(row)
@@ -0,0 +1,245 @@
+"""
+Dry-run size and runtime estimator for a generator suite.
+
+Samples a few files per strategy through the script's generate_file() hook,
+without touching the disk, and extrapolates the uncompressed bytes, the
+deflated zip size and the wall time of a full run. With --budget it also
+rescales the suite's size knobs until the predicted size fits.
+
+    python -m tools.estimate krish
+    python -m tools.estimate aryan lavanya --samples 5
+    python -m tools.estimate ahshit --budget 90MB --measure zip
+"""
+import argparse
+import contextlib
+import io
+import random
+import time
+import zlib
+
+from tools.suites import SUITES, get_suite, load_generator
+
+MB = 1024 * 1024
+
+# Local header + central directory entry + data descriptor, plus the name twice.
+ZIP_MEMBER_OVERHEAD = 30 + 46 + 16 + 2 * len("input/input00.txt")
+
+# Linear strategies are sampled with their count knob reduced to this.
+LINEAR_SAMPLE_UNITS = 2
+
+
+class CountingWriter:
+    """Text or bytes sink that only counts raw bytes and deflates them as zip would."""
+
+    def __init__(self):
+        self.raw_bytes = 0
+        self.zip_bytes = 0
+        self.zip_seconds = 0.0
+        self._deflate = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+
+    def write(self, text):
+        data = text.encode("utf-8") if isinstance(text, str) else text
+        self.raw_bytes += len(data)
+        start = time.perf_counter()
+        self.zip_bytes += len(self._deflate.compress(data))
+        self.zip_seconds += time.perf_counter() - start
+        return len(text)
+
+    def close(self):
+        start = time.perf_counter()
+        self.zip_bytes += len(self._deflate.flush()) + ZIP_MEMBER_OVERHEAD
+        self.zip_seconds += time.perf_counter() - start
+
+
+class Estimate:
+    def __init__(self, raw_bytes=0.0, zip_bytes=0.0, seconds=0.0):
+        self.raw_bytes = raw_bytes
+        self.zip_bytes = zip_bytes
+        self.seconds = seconds
+
+    def __add__(self, other):
+        return Estimate(self.raw_bytes + other.raw_bytes,
+                        self.zip_bytes + other.zip_bytes,
+                        self.seconds + other.seconds)
+
+    def scaled(self, factor):
+        return Estimate(self.raw_bytes * factor, self.zip_bytes * factor, self.seconds * factor)
+
+    def measure(self, kind):
+        return self.zip_bytes if kind == "zip" else self.raw_bytes
+
+
+def sample_file(module, i):
+    """Runs one file through generate_file() into counting writers."""
+    f_in = CountingWriter()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        output_text = module.generate_file(i, f_in)
+    elapsed = time.perf_counter() - start
+    f_in.close()
+
+    f_out = CountingWriter()
+    f_out.write(output_text)
+    f_out.close()
+
+    return Estimate(f_in.raw_bytes + f_out.raw_bytes,
+                    f_in.zip_bytes + f_out.zip_bytes,
+                    elapsed + f_out.zip_seconds)
+
+
+def estimate_strategy(module, strategy, files, samples, rng):
+    """Mean of `samples` sampled files, extrapolated to the whole strategy."""
+    factor = 1.0
+    saved = {}
+    if strategy.linear:
+        for knob in strategy.knobs:
+            value = getattr(module, knob)
+            reduced = min(value, LINEAR_SAMPLE_UNITS)
+            saved[knob] = value
+            setattr(module, knob, reduced)
+            factor *= value / reduced
+    try:
+        picked = rng.sample(files, min(samples, len(files)))
+        total = Estimate()
+        for i in picked:
+            total = total + sample_file(module, i)
+    finally:
+        for knob, value in saved.items():
+            setattr(module, knob, value)
+    return total.scaled(factor * len(files) / len(picked))
+
+
+def estimate_suite(suite, module, samples, rng, strategies=None):
+    """Returns {strategy name: Estimate} for the files the script generates."""
+    results = {}
+    for strategy in strategies or suite.strategies:
+        files = [i for i in strategy.files if i < module.NUM_FILES]
+        if files:
+            results[strategy.name] = estimate_strategy(module, strategy, files, samples, rng)
+    return results
+
+
+def total_of(results):
+    total = Estimate()
+    for estimate in results.values():
+        total = total + estimate
+    return total
+
+
+def apply_knobs(module, values):
+    for knob, value in values.items():
+        setattr(module, knob, value)
+
+
+def scaled_knobs(suite, module, base, scale):
+    values = {}
+    for knob, value in base.items():
+        new_value = max(suite.floors.get(knob, 1), int(value * scale))
+        cap = suite.caps.get(knob)
+        if cap is not None:
+            new_value = min(new_value, getattr(module, cap))
+        values[knob] = new_value
+    return values
+
+
+def fit_budget(suite, module, budget, measure, samples, rng, rounds=6, tolerance=0.02):
+    """
+    Rescales every knob of the suite by one common factor until the predicted
+    size is within `tolerance` of `budget`. Strategies without knobs are
+    sampled once and treated as a fixed cost.
+    Returns (knob values, results) for the largest prediction under budget,
+    or for the last round if none fit.
+    """
+    base = {knob: getattr(module, knob) for knob in suite.knobs}
+    knobbed = [s for s in suite.strategies if s.knobs]
+    fixed_strategies = [s for s in suite.strategies if not s.knobs]
+    fixed = estimate_suite(suite, module, samples, rng, fixed_strategies) if fixed_strategies else {}
+    fixed_size = total_of(fixed).measure(measure)
+
+    scale = 1.0
+    best = None
+    last = None
+    previous_values = None
+    for _ in range(rounds):
+        values = scaled_knobs(suite, module, base, scale)
+        if values == previous_values:
+            break
+        apply_knobs(module, values)
+        results = dict(fixed)
+        results.update(estimate_suite(suite, module, samples, rng, knobbed))
+        size = total_of(results).measure(measure)
+        last = (values, results)
+        if size <= budget and (best is None or size > total_of(best[1]).measure(measure)):
+            best = last
+        if abs(size - budget) <= tolerance * budget:
+            break
+        variable = size - fixed_size
+        if variable <= 0 or budget <= fixed_size:
+            break
+        scale *= (budget - fixed_size) / variable
+        previous_values = values
+
+    apply_knobs(module, base)
+    return best or last
+
+
+def format_row(name, files, estimate):
+    return (f"  {name:<14}{files:>6}{estimate.raw_bytes / MB:>12.2f}"
+            f"{estimate.zip_bytes / MB:>12.2f}{estimate.seconds:>10.1f}")
+
+
+def report(suite, module, results):
+    print(f"{suite.name} ({module.NUM_FILES} files)")
+    print(f"  {'strategy':<14}{'files':>6}{'raw MB':>12}{'zip MB':>12}{'seconds':>10}")
+    for strategy in suite.strategies:
+        if strategy.name in results:
+            files = len([i for i in strategy.files if i < module.NUM_FILES])
+            print(format_row(strategy.name, files, results[strategy.name]))
+    print(format_row("TOTAL", module.NUM_FILES, total_of(results)))
+
+
+def parse_size(text):
+    """'85MB' / '500KB' / '1GB' / plain bytes -> bytes."""
+    units = {"KB": 1024, "MB": MB, "GB": 1024 * MB}
+    text = text.strip().upper()
+    for suffix, factor in units.items():
+        if text.endswith(suffix):
+            return int(float(text[:-len(suffix)]) * factor)
+    return int(text)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("suites", nargs="+", choices=sorted(SUITES))
+    parser.add_argument("--samples", type=int, default=3,
+                        help="files sampled per strategy (default: 3)")
+    parser.add_argument("--budget", type=parse_size,
+                        help="size budget per suite, e.g. 85MB; rescales the knobs to fit")
+    parser.add_argument("--measure", choices=("zip", "raw"), default="zip",
+                        help="which size --budget applies to (default: zip)")
+    parser.add_argument("--seed", type=int, help="seed for picking the sampled files")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    for name in args.suites:
+        suite = get_suite(name)
+        module = load_generator(suite)
+
+        if args.budget is None:
+            report(suite, module, estimate_suite(suite, module, args.samples, rng))
+            print()
+            continue
+
+        values, results = fit_budget(suite, module, args.budget, args.measure, args.samples, rng)
+        report(suite, module, results)
+        size = total_of(results).measure(args.measure)
+        verdict = "fits" if size <= args.budget else "DOES NOT fit"
+        print(f"  Predicted {args.measure} size {size / MB:.2f} MB {verdict} "
+              f"the {args.budget / MB:.2f} MB budget with:")
+        for knob, value in values.items():
+            print(f"    {knob} = {value}  (currently {getattr(module, knob)})")
+        print()
+
+
+if __name__ == "__main__":
+    main()
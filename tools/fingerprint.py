@@ -0,0 +1,206 @@
+"""
+Per-file fingerprints for incremental rebuilds (tools/generate.py).
+
+The fingerprint of file i hashes everything its bytes depend on:
+
+- the seed it is drawn from (tools/seeding.py);
+- its strategy code path: generate_file and every module-level function or
+  class reachable from it by name, with each `if` whose test only involves
+  the file index `i` (and constant settings) cut down to the branch file i
+  takes. Editing krish's `elif i == 98:` branch changes the fingerprint of
+  file 98 only; editing make_valid_case changes every file that can call it;
+- the values of the module settings that code path reads (TARGET_NM,
+  ENGINE, ...) and the versions of the libraries it touches (NumPy's
+  streams are only guaranteed within a version). Functions held in a
+  setting (ahshit's KILLER_PATTERNS) are followed like called ones, and
+  lambdas there are hashed by their compiled code, never by their repr;
+- the full source of repo-local modules the script imports
+  (pairing_solver.py, diagonal_solver.py, tools/seeding.py).
+
+Comments, the script's main() and settings such as ZIP_NAME are not on any
+code path, so editing them rebuilds nothing.
+"""
+import ast
+import copy
+import hashlib
+import importlib.util
+import inspect
+import os
+import types
+
+from tools.suites import REPO_ROOT
+
+FILE_INDEX = "i"  # Name of the file-index parameter in every script
+ENTRY = "generate_file"
+SEED_SETTING = "MASTER_SEED"  # Hashed as the effective seed instead (--seed may override it)
+SETTING_TYPES = (int, float, str, bool, type(None), tuple, list, dict, range, bytes, frozenset)
+
+
+def _constants(module):
+    """Module settings an index test may read, e.g. `if i < NUM_EDGE`."""
+    return {name: value for name, value in vars(module).items()
+            if name.isupper() and isinstance(value, SETTING_TYPES)}
+
+
+def _code_digest(code):
+    """Hash of a code object and the code objects nested in it; line numbers and addresses left out."""
+    h = hashlib.sha256(code.co_code)
+    h.update(repr((code.co_names, code.co_varnames, code.co_freevars)).encode())
+    for const in code.co_consts:
+        h.update((_code_digest(const) if isinstance(const, types.CodeType) else repr(const)).encode())
+    return h.hexdigest()
+
+
+def _functions_in(value):
+    """Functions held anywhere inside a setting's (nested) containers."""
+    if isinstance(value, types.FunctionType):
+        return [value]
+    if isinstance(value, dict):
+        value = [*value.keys(), *value.values()]
+    if isinstance(value, (tuple, list, frozenset)):
+        return [f for item in value for f in _functions_in(item)]
+    return []
+
+
+def _setting_repr(value, module_defs, follow):
+    """
+    repr(value), except that a function inside it stands in as its name if
+    it is a module definition (its name is added to `follow`), or else as
+    the digest of its code (the globals that code reads go to `follow`).
+    """
+    if not _functions_in(value):
+        return repr(value)
+    if isinstance(value, types.FunctionType):
+        func = inspect.unwrap(value)
+        if func.__name__ in module_defs and func.__code__.co_filename == module_defs[func.__name__]:
+            follow.append(func.__name__)
+            return f"<def {func.__name__}>"
+        follow.extend(func.__code__.co_names)
+        return f"<code {_code_digest(func.__code__)}>"
+    if isinstance(value, dict):
+        items = (f"{_setting_repr(k, module_defs, follow)}: {_setting_repr(v, module_defs, follow)}"
+                 for k, v in value.items())
+        return "{" + ", ".join(items) + "}"
+    items = ", ".join(_setting_repr(item, module_defs, follow) for item in value)
+    return f"{type(value).__name__}({items})"
+
+
+def _index_test(test, constants):
+    """True if `test` can be evaluated from the file index and settings alone."""
+    names = {n.id for n in ast.walk(test) if isinstance(n, ast.Name)}
+    calls = any(isinstance(n, (ast.Call, ast.Attribute, ast.Subscript)) for n in ast.walk(test))
+    return FILE_INDEX in names and not calls and names <= constants.keys() | {FILE_INDEX}
+
+
+class _BranchPruner(ast.NodeTransformer):
+    """Cuts index-only `if`s down to the branch taken; the tests themselves stay."""
+
+    def __init__(self, i, constants):
+        self.i = i
+        self.constants = constants
+
+    def visit_If(self, node):
+        if _index_test(node.test, self.constants):
+            expr = compile(ast.Expression(node.test), "<test>", "eval")
+            taken = bool(eval(expr, dict(self.constants), {FILE_INDEX: self.i}))
+            if taken:
+                node.orelse = []
+            else:
+                node.body = []
+        return self.generic_visit(node)
+
+
+def _prunable(func):
+    """Functions taking the index that never rebind it, so `i` is the file index throughout."""
+    if not isinstance(func, (ast.FunctionDef, ast.AsyncFunctionDef)):
+        return False
+    params = [a.arg for a in func.args.posonlyargs + func.args.args + func.args.kwonlyargs]
+    rebinds = any(isinstance(n, ast.Name) and n.id == FILE_INDEX and isinstance(n.ctx, ast.Store)
+                  for n in ast.walk(func))
+    return FILE_INDEX in params and not rebinds
+
+
+def _local_imports(tree):
+    """Source files of repo-local modules imported at module level."""
+    names = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            names += [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names.append(node.module)
+    paths = []
+    for name in names:
+        try:
+            spec = importlib.util.find_spec(name)
+        except (ImportError, ValueError):
+            continue
+        origin = spec.origin if spec else None
+        if origin and os.path.isfile(origin) and origin.startswith(REPO_ROOT + os.sep):
+            paths.append(origin)
+    return sorted(set(paths))
+
+
+class ScriptFingerprints:
+    """Parses a loaded generator script once; fingerprint(i, seed) is then cheap."""
+
+    def __init__(self, module):
+        with open(module.__file__) as f:
+            self.tree = ast.parse(f.read())
+        self.module = module
+        self.constants = _constants(module)
+        self.defs = {node.name: node for node in self.tree.body
+                     if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef))}
+        self.imports = []
+        for path in _local_imports(self.tree):
+            with open(path, 'rb') as f:
+                digest = hashlib.sha256(f.read()).hexdigest()
+            self.imports.append((os.path.relpath(path, REPO_ROOT), digest))
+
+    def code_path(self, i, entry=ENTRY):
+        """(dumps of the definitions reachable from entry, pruned for file i; global names they read)."""
+        dumps, names = {}, set()
+        todo = [entry]
+        while todo:
+            name = todo.pop()
+            if name in dumps or name not in self.defs:
+                continue
+            node = self.defs[name]
+            if _prunable(node):
+                node = _BranchPruner(i, self.constants).visit(copy.deepcopy(node))
+            dumps[name] = ast.dump(node)
+            for n in ast.walk(node):
+                if isinstance(n, ast.Name):
+                    names.add(n.id)
+                    todo.append(n.id)
+        return dumps, names
+
+    def fingerprint(self, i, seed):
+        dumps, names = self.code_path(i)
+        settings, versions = [], []
+        module_vars = vars(self.module)
+        module_defs = {name: self.module.__file__ for name in self.defs}
+        done = set()
+        todo = sorted(names - dumps.keys() - {SEED_SETTING})
+        while todo:
+            name = todo.pop(0)
+            if name in done or name not in module_vars:  # A local or a builtin
+                continue
+            done.add(name)
+            value = module_vars[name]
+            if isinstance(value, SETTING_TYPES):
+                follow = []
+                settings.append((name, _setting_repr(value, module_defs, follow)))
+                # Functions reached only through a setting join the code path
+                for reached in follow:
+                    if reached in self.defs and reached not in dumps:
+                        more, more_names = self.code_path(i, entry=reached)
+                        dumps.update(more)
+                        todo += sorted(more_names - dumps.keys() - done - {SEED_SETTING})
+                    elif reached not in self.defs:
+                        todo.append(reached)
+            elif getattr(value, "__version__", None):
+                versions.append((name, str(value.__version__)))
+        settings.sort()
+        parts = [repr(seed), repr(sorted(dumps.items())), repr(settings), repr(versions),
+                 repr(self.imports)]
+        return hashlib.sha256("\n".join(parts).encode()).hexdigest()
@@ -0,0 +1,371 @@
+"""
+Differential fuzzer for the reference solvers duplicated across the repo.
+
+For each problem, random small/medium cases are fed to every registered
+solver variant; any case where the variants disagree is shrunk greedily and
+reported with each variant's answer. Problems that accept many answers
+(ranjan) register a checker instead: a case fails when any variant's answer
+is rejected by it. Batches run across a process pool and
+are seeded from (--seed, batch index), so a reported failure can be replayed.
+
+    python -m tools.fuzz romanch aryan --cases 1000000 --jobs 8
+    python -m tools.fuzz krish --size medium --seed 7
+
+New fast solvers should be registered here next to the reference they replace.
+"""
+import argparse
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+
+from tools.suites import load_script
+
+
+@dataclass
+class Variant:
+    label: str
+    script: str   # Path relative to the repo root
+    func: str     # Function name inside the script
+    call: object  # call(func, case) -> answer; must not mutate the case
+
+
+@dataclass
+class Problem:
+    name: str
+    make_case: object  # make_case(rng, size) -> case ("small" or "medium")
+    shrink: object     # shrink(case) -> smaller candidate cases
+    variants: list
+    checker: Variant = None  # call(check, case, answer) -> True if accepted; replaces agreement
+
+
+# ==========================================
+# CASE GENERATORS AND SHRINKERS
+# ==========================================
+
+def krish_case(rng, size):
+    """Valid AP matrix, one swapped pair, or an arbitrary permutation of 0..nm-1."""
+    limit = 4 if size == "small" else 30
+    n, m = rng.randint(1, limit), rng.randint(1, limit)
+    kind = rng.randrange(3)
+    if kind == 2:
+        values = list(range(n * m))
+        rng.shuffle(values)
+        return n, m, [values[r * m:(r + 1) * m] for r in range(n)]
+    starts = list(range(n))
+    rng.shuffle(starts)
+    matrix = []
+    for s in starts:
+        row = [s + k * n for k in range(m)]
+        rng.shuffle(row)
+        matrix.append(row)
+    if kind == 1 and n > 1:
+        r1, r2 = rng.sample(range(n), 2)
+        c1, c2 = rng.randrange(m), rng.randrange(m)
+        matrix[r1][c1], matrix[r2][c2] = matrix[r2][c2], matrix[r1][c1]
+    return n, m, matrix
+
+
+def _renumber(matrix):
+    """Replaces each value by its rank, so the matrix is again a permutation of 0..nm-1."""
+    order = sorted(x for row in matrix for x in row)
+    rank = {x: k for k, x in enumerate(order)}
+    return [[rank[x] for x in row] for row in matrix]
+
+
+def krish_shrink(case):
+    # Strictly smaller: drop one row or one column, then renumber the rest
+    # (relative order kept) so the input stays a permutation of 0..nm-1.
+    n, m, matrix = case
+    if n > 1:
+        for r in range(n):
+            yield n - 1, m, _renumber(matrix[:r] + matrix[r + 1:])
+    if m > 1:
+        for c in range(m):
+            yield n, m - 1, _renumber([row[:c] + row[c + 1:] for row in matrix])
+
+
+def atharv_case(rng, size):
+    limit = 8 if size == "small" else 200
+    n = rng.randint(1, limit)
+    s = "".join(rng.choices(rng.choice(["ab", "abc", "a!b"]), k=n))
+    t_len = n if rng.random() < 0.9 else rng.randint(1, limit)
+    t = "".join(rng.choices(rng.choice(["xy", "xyz", "x?"]), k=t_len))
+    return s, t
+
+
+def atharv_shrink(case):
+    s, t = case
+    if len(s) > 1 and len(t) > 1:
+        for k in range(min(len(s), len(t))):
+            yield s[:k] + s[k + 1:], t[:k] + t[k + 1:]
+
+
+def aryan_case(rng, size):
+    limit = 6 if size == "small" else 40
+    n = rng.randint(1, limit)
+    bound = rng.choice([3, 100, 10**9])
+    return [[rng.randint(-bound, bound) for _ in range(n)] for _ in range(n)]
+
+
+def aryan_shrink(grid):
+    n = len(grid)
+    if n > 1:
+        yield [row[:-1] for row in grid[:-1]]
+        yield [row[1:] for row in grid[1:]]
+    for r in range(n):
+        for c in range(n):
+            if grid[r][c] not in (-1, 0, 1):
+                smaller = [row[:] for row in grid]
+                smaller[r][c] = grid[r][c] // 2 if grid[r][c] > 0 else -((-grid[r][c]) // 2)
+                yield smaller
+
+
+def pairing_case(rng, size):
+    """(n, d, a) for romanch: a few clustered values so pairs often fit d."""
+    limit = 9 if size == "small" else 200
+    n = rng.randint(1, limit)
+    d = rng.randint(0, 10)
+    return n, d, [rng.randint(1, 30) for _ in range(n)]
+
+
+def pairing_shrink(case):
+    # Dropping two elements keeps n's parity, which picks the solver branch.
+    n, d, a = case
+    for k in range(n - 2):
+        yield n - 2, d, a[:k] + a[k + 2:]
+    for k in range(n):
+        if n > 1:
+            yield n - 1, d, a[:k] + a[k + 1:]
+    if d > 0:
+        yield n, d // 2, a
+
+
+def lavanya_case(rng, size):
+    limit = 8 if size == "small" else 300
+    n = rng.randint(1, limit)
+    top = rng.choice([5, 20, 10**6])
+    return n, rng.randint(1, n), [rng.randint(1, top) for _ in range(n)]
+
+
+def lavanya_shrink(case):
+    n, d, e = case
+    for k in range(n):
+        if n > 1:
+            yield n - 1, min(d, n - 1), e[:k] + e[k + 1:]
+    if d > 1:
+        yield n, d - 1, e
+    for k in range(n):
+        if e[k] > 1:
+            yield n, d, e[:k] + [e[k] // 2] + e[k + 1:]
+
+
+def ranjan_case(rng, size):
+    top = 1000 if size == "small" else 10**7
+    return rng.randint(1, top)
+
+
+def ranjan_shrink(c):
+    if c > 1:
+        yield c // 2
+        yield c - 1
+
+
+def _krish_numpy(func, case):
+    import numpy as np
+    n, m, matrix = case
+    return func(n, m, np.array(matrix, dtype=np.int64))
+
+
+def _as_array(grid):
+    import numpy as np
+    return np.array(grid, dtype=np.int64).reshape(len(grid), len(grid))
+
+
+def _stream_rows(stream_class, grid, rows):
+    stream = stream_class(len(grid))
+    for row in rows:
+        stream.add_row(row)
+    return stream.answer()
+
+
+PROBLEMS = {
+    "krish": Problem("krish", krish_case, krish_shrink, [
+        Variant("solve", "krish/testcases.py", "solve", lambda f, c: f(*c)),
+        Variant("solve_fast[list]", "krish/testcases.py", "solve_fast", lambda f, c: f(*c)),
+        Variant("solve_fast[numpy]", "krish/testcases.py", "solve_fast", _krish_numpy),
+    ]),
+    "atharv": Problem("atharv", atharv_case, atharv_shrink, [
+        Variant("solve", "atharv/testcases.py", "solve", lambda f, c: f(*c)),
+        Variant("solve_fast[str]", "atharv/testcases.py", "solve_fast", lambda f, c: f(*c)),
+        Variant("solve_fast[bytes]", "atharv/testcases.py", "solve_fast",
+                lambda f, c: f(c[0].encode(), c[1].encode())),
+    ]),
+    "aryan": Problem("aryan", aryan_case, aryan_shrink, [
+        Variant("testcases.solve", "aryan/testcases.py", "solve", lambda f, g: f(g)),
+        Variant("ahshit.solve_python_logic", "aryan/one_more/ahshit.py", "solve_python_logic",
+                lambda f, g: f(len(g), g)),
+        Variant("solve_diagonals", "aryan/diagonal_solver.py", "solve_diagonals", lambda f, g: f(g)),
+        Variant("DiagonalStream[list]", "aryan/diagonal_solver.py", "DiagonalStream",
+                lambda f, g: _stream_rows(f, g, g)),
+        Variant("DiagonalStream[numpy]", "aryan/diagonal_solver.py", "DiagonalStream",
+                lambda f, g: _stream_rows(f, g, _as_array(g))),
+    ]),
+    "romanch": Problem("romanch", pairing_case, pairing_shrink, [
+        Variant("testcases.solve", "romanch/testcases.py", "solve",
+                lambda f, c: f(c[0], c[1], list(c[2]))),
+        Variant("killer.solve_correctly", "romanch/one_more/killer.py", "solve_correctly",
+                lambda f, c: f(c[0], c[1], list(c[2]))),
+        Variant("tlecases.solve", "romanch/tle_cases/tlecases.py", "solve",
+                lambda f, c: f(c[0], c[1], list(c[2]))),
+        Variant("solve_pairs", "romanch/pairing_solver.py", "solve_pairs", lambda f, c: f(*c)),
+        Variant("solve_pairs[presorted]", "romanch/pairing_solver.py", "solve_pairs",
+                lambda f, c: f(c[0], c[1], sorted(c[2]), presorted=True)),
+    ]),
+    # Any (a, b) passing custom_checker.cpp's equation is right: both variants
+    # share solve's closed form, so they are checked, not compared.
+    "ranjan": Problem("ranjan", ranjan_case, ranjan_shrink, [
+        Variant("solve", "ranjan/testcase.py", "solve", lambda f, c: f(c)),
+        Variant("answer_lines", "ranjan/testcase.py", "answer_lines",
+                lambda f, c: tuple(map(int, f([c]).split()))),
+    ], checker=Variant("check", "ranjan/testcase.py", "check", lambda f, c, answer: f(c, *answer))),
+    "lavanya": Problem("lavanya", lavanya_case, lavanya_shrink, [
+        Variant("solve", "lavanya/testcases.py", "solve", lambda f, c: f(c[0], c[1], list(c[2]))),
+        Variant("solve_fast", "lavanya/testcases.py", "solve_fast",
+                lambda f, c: f(c[0], c[1], list(c[2]))),
+        Variant("solve_batch", "lavanya/testcases.py", "solve_batch",
+                lambda f, c: f([(c[0], c[1], list(c[2]))])[0]),
+    ]),
+}
+
+
+# ==========================================
+# RUNNING VARIANTS
+# ==========================================
+
+_loaded = {}
+
+
+def resolve(variant):
+    """Loads (once per process) and returns the variant's function."""
+    key = variant.script
+    if key not in _loaded:
+        module_name = "fuzz_" + key.replace("/", "_").replace(".py", "")
+        _loaded[key] = load_script(key, module_name)
+    return getattr(_loaded[key], variant.func)
+
+
+def run_variants(problem, case):
+    answers = []
+    for variant in problem.variants:
+        try:
+            answers.append(variant.call(resolve(variant), case))
+        except Exception as exc:  # A crash is a disagreement like any other
+            answers.append(f"raised {type(exc).__name__}: {exc}")
+    return answers
+
+
+def accepted(problem, case, answer):
+    try:
+        return problem.checker.call(resolve(problem.checker), case, answer) is True
+    except Exception:  # A malformed answer (e.g. a crash message) is rejected
+        return False
+
+
+def fails(problem, case):
+    """True if the variants disagree on case, or with a checker, if any answer is rejected."""
+    answers = run_variants(problem, case)
+    if problem.checker is not None:
+        return not all(accepted(problem, case, answer) for answer in answers)
+    return any(answer != answers[0] for answer in answers[1:])
+
+
+def shrink(problem, case):
+    """Greedy minimization: keep any smaller candidate that still fails."""
+    improved = True
+    while improved:
+        improved = False
+        for candidate in problem.shrink(case):
+            if fails(problem, candidate):
+                case = candidate
+                improved = True
+                break
+    return case
+
+
+def fuzz_batch(name, seed, count, size):
+    """Worker: runs `count` cases; returns (cases run, first failing case or None)."""
+    problem = PROBLEMS[name]
+    rng = random.Random(seed)
+    for done in range(count):
+        case_size = size if size != "mixed" else rng.choice(("small", "medium"))
+        case = problem.make_case(rng, case_size)
+        if fails(problem, case):
+            return done + 1, case
+    return count, None
+
+
+def report_failure(problem, case, batch_seed):
+    minimized = shrink(problem, case)
+    kind = "REJECTED ANSWER" if problem.checker is not None else "DISAGREEMENT"
+    print(f"  {kind} in {problem.name} (batch seed {batch_seed})")
+    print(f"    input: {minimized!r}")
+    for variant, answer in zip(problem.variants, run_variants(problem, minimized)):
+        verdict = ""
+        if problem.checker is not None:
+            verdict = "  (accepted)" if accepted(problem, minimized, answer) else "  (rejected)"
+        print(f"    {variant.label:<28} -> {answer!r}{verdict}")
+
+
+def fuzz_problem(problem, cases, batch_size, jobs, seed, size):
+    if len(problem.variants) < 2 and problem.checker is None:
+        print(f"{problem.name}: only one solver registered, nothing to compare")
+        return True
+
+    batches = (cases + batch_size - 1) // batch_size
+    start = time.perf_counter()
+    total = 0
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {}
+        for b in range(batches):
+            batch_seed = seed * 1_000_003 + b
+            count = min(batch_size, cases - b * batch_size)
+            futures[pool.submit(fuzz_batch, problem.name, batch_seed, count, size)] = batch_seed
+        for future in as_completed(futures):
+            ran, failing = future.result()
+            total += ran
+            if failing is not None:
+                pool.shutdown(cancel_futures=True)
+                report_failure(problem, failing, futures[future])
+                return False
+
+    elapsed = time.perf_counter() - start
+    verdict = "pass the checker" if problem.checker is not None else "agree"
+    print(f"{problem.name}: {total} cases, {len(problem.variants)} variants {verdict} "
+          f"({total / elapsed:,.0f} cases/s)")
+    return True
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("problems", nargs="*", metavar="problem",
+                        help=f"any of {', '.join(sorted(PROBLEMS))} (default: all)")
+    parser.add_argument("--cases", type=int, default=100_000, help="cases per problem")
+    parser.add_argument("--batch", type=int, default=2_000, help="cases per pool task")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument("--size", choices=("small", "medium", "mixed"), default="mixed")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    for name in args.problems:
+        if name not in PROBLEMS:
+            parser.error(f"unknown problem {name!r}")
+
+    ok = True
+    for name in args.problems or sorted(PROBLEMS):
+        ok &= fuzz_problem(PROBLEMS[name], args.cases, args.batch, args.jobs, args.seed, args.size)
+    raise SystemExit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
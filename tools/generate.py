@@ -0,0 +1,338 @@
+"""
+Parallel generation engine for every registered suite.
+
+Files of a suite are independent, so each file index is one task: a worker
+process imports the script once, calls its generate_file(i, f_in) hook and
+writes input/output straight to disk. Output goes where the script itself
+would write it (or under --out), with the script's own file names.
+
+Every file is hashed while it is written. A file whose content already
+exists in the suite (ranjan's WALL files, Shreya's repeated answers) is
+replaced by a hard link to the first copy, and manifest.json in the output
+root records each file's hash, size and what it duplicates.
+
+Rebuilds are incremental. The manifest also keeps each file's fingerprint
+(tools/fingerprint.py: seed, settings and strategy code path), and only
+files whose fingerprint changed are regenerated. The rest are re-hashed in
+parallel and rebuilt only if missing or altered on disk. The manifest is
+rewritten after every finished file, so an interrupted run resumes where
+it stopped. --force rebuilds everything.
+
+    python -m tools.generate lavanya --jobs 32
+    python -m tools.generate krish --files 95-99 --force
+    python -m tools.generate romanch romanch_tle --files 0-9,20 --out /tmp/suites
+
+--log PATH turns on instrumentation (tools/instrument.py) and appends one
+JSON line per file: the time spent building cases, solving, formatting and
+writing, bytes written and peak memory. --tracemalloc adds traced peaks, and
+--profile 98 runs file 98 under cProfile and dumps its stats.
+
+    python -m tools.generate krish --files 98 --force --log run.jsonl --profile 98
+
+Zipping is left to the scripts (krish's main) or to the uploader.
+"""
+import argparse
+import contextlib
+import hashlib
+import io
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+from tools.fingerprint import ScriptFingerprints
+from tools.instrument import FileProbe, Instrumentation, format_record
+from tools.suites import SUITES, get_suite, load_generator, script_dir
+
+MB = 1024 * 1024
+MANIFEST_NAME = "manifest.json"
+SCRIPT_SEED = "script"  # --seed default: leave each script's MASTER_SEED alone
+
+_modules = {}
+
+
+class HashingWriter:
+    """Binary file wrapper that hashes what is written; text is encoded as UTF-8."""
+
+    def __init__(self, f):
+        self.f = f
+        self.sha = hashlib.sha256()
+
+    def write(self, data):
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        self.sha.update(data)
+        return self.f.write(data)
+
+
+def generator_for(suite):
+    """Loads (once per process) and returns the suite's script module."""
+    if suite.name not in _modules:
+        _modules[suite.name] = load_generator(suite)
+    return _modules[suite.name]
+
+
+def output_root(suite, out):
+    if out is not None:
+        return os.path.join(out, suite.name)
+    return os.path.join(script_dir(suite), suite.out_dir)
+
+
+def open_fresh(root, name):
+    """Opens root/name for binary writing. An old copy is unlinked first so a hard link to it keeps its content."""
+    path = os.path.join(root, name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    if os.path.lexists(path):
+        os.remove(path)
+    return open(path, 'wb')
+
+
+def generate_one(name, i, root, seed, instrument=None):
+    """
+    Worker: writes input/output file i of suite `name`.
+    Every script seeds file i from (problem, MASTER_SEED, i) (tools/seeding.py),
+    so the bytes do not depend on the worker or on the other files.
+    Returns (i, seconds, {relative name: (sha256, bytes)}, log record or None).
+    """
+    suite = SUITES[name]
+    module = generator_for(suite)
+    if seed != SCRIPT_SEED:
+        module.MASTER_SEED = seed
+    input_name = suite.input_name.format(i=i)
+    output_name = suite.output_name.format(i=i)
+
+    probe = FileProbe(name, module, i, instrument) if instrument is not None else None
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()), probe or contextlib.nullcontext():
+        with open_fresh(root, input_name) as f:
+            f_in = HashingWriter(f)
+            output_text = module.generate_file(i, probe.writer(f_in) if probe else f_in)
+        with open_fresh(root, output_name) as f:
+            f_out = HashingWriter(f)
+            (probe.writer(f_out) if probe else f_out).write(output_text)
+    elapsed = time.perf_counter() - start
+
+    written = {}
+    for rel, writer in ((input_name, f_in), (output_name, f_out)):
+        written[rel] = (writer.sha.hexdigest(), os.path.getsize(os.path.join(root, rel)))
+    return i, elapsed, written, probe.record() if probe else None
+
+
+def load_manifest(root):
+    path = os.path.join(root, MANIFEST_NAME)
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)["files"]
+
+
+def save_manifest(root, suite, files):
+    """
+    Writes manifest.json atomically; within each group of equal hashes the
+    first name is the original.
+    """
+    originals = {}
+    for rel in sorted(files):
+        entry = files[rel]
+        entry.pop("duplicate_of", None)
+        if entry["sha256"] in originals:
+            entry["duplicate_of"] = originals[entry["sha256"]]
+        else:
+            originals[entry["sha256"]] = rel
+    path = os.path.join(root, MANIFEST_NAME)
+    with open(path + ".tmp", 'w') as f:
+        json.dump({"suite": suite.name, "files": files}, f, indent=1, sort_keys=True)
+    os.replace(path + ".tmp", path)
+
+
+def file_sha256(path):
+    """sha256 of a file on disk, or None if it is missing."""
+    sha = hashlib.sha256()
+    try:
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(MB), b""):
+                sha.update(block)
+    except FileNotFoundError:
+        return None
+    return sha.hexdigest()
+
+
+def stale_files(suite, files, root, manifest, fingerprints, jobs):
+    """
+    Files to regenerate: a fingerprint missing from the manifest or changed
+    (None, for a fresh-entropy seed, always counts as changed), or an input /
+    output whose bytes on disk no longer match the recorded hash. The hashes
+    are checked on a thread pool (hashlib releases the GIL).
+    """
+    stale, to_verify = set(), {}
+    for i in files:
+        for rel in (suite.input_name.format(i=i), suite.output_name.format(i=i)):
+            entry = manifest.get(rel)
+            if fingerprints[i] is None or entry is None or entry.get("fingerprint") != fingerprints[i]:
+                stale.add(i)
+            else:
+                to_verify[rel] = i
+    to_verify = {rel: i for rel, i in to_verify.items() if i not in stale}
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        hashes = pool.map(lambda rel: file_sha256(os.path.join(root, rel)), to_verify)
+        for (rel, i), sha in zip(to_verify.items(), hashes):
+            if sha != manifest[rel]["sha256"]:
+                stale.add(i)
+    return sorted(stale)
+
+
+def link_duplicate(root, rel, original):
+    """Replaces root/rel with a hard link to root/original (plain copy kept if links fail)."""
+    path = os.path.join(root, rel)
+    temp = path + ".link"
+    try:
+        os.link(os.path.join(root, original), temp)
+    except OSError:
+        return False
+    os.replace(temp, path)
+    return True
+
+
+def parse_indices(text):
+    """'95-99' / '3' / '0-9,50' -> set of file indices."""
+    picked = set()
+    for part in text.split(","):
+        first, _, last = part.strip().partition("-")
+        picked.update(range(int(first), int(last or first) + 1))
+    return picked
+
+
+def parse_files(text, num_files):
+    """Like parse_indices (None -> every file), checked against NUM_FILES."""
+    if text is None:
+        return list(range(num_files))
+    picked = parse_indices(text)
+    out_of_range = [i for i in picked if not 0 <= i < num_files]
+    if out_of_range:
+        raise SystemExit(f"File indices {sorted(out_of_range)} are outside 0-{num_files - 1}")
+    return sorted(picked)
+
+
+def parse_seed(text):
+    """'none' -> None (fresh entropy), else an int; the default keeps each script's MASTER_SEED."""
+    if text == SCRIPT_SEED:
+        return text
+    return None if text.lower() == "none" else int(text)
+
+
+def log_event(log, event, **fields):
+    """Appends one JSON line to the structured log (no-op without --log)."""
+    if log is None:
+        return
+    fields = {"event": event, "time": time.time(), **fields}
+    log.write(json.dumps(fields, sort_keys=True) + "\n")
+    log.flush()
+
+
+def run_files(suite, files, jobs, root, seed, instrument):
+    """Yields generate_one() results as files finish (in-process when jobs == 1)."""
+    if jobs == 1:
+        for i in files:
+            yield generate_one(suite.name, i, root, seed, instrument)
+        return
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(generate_one, suite.name, i, root, seed, instrument) for i in files]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def run_suite(suite, files, jobs, out, seed, force=False, instrument=None, log=None):
+    root = output_root(suite, out)
+    start = time.perf_counter()
+    manifest = load_manifest(root)
+    module = generator_for(suite)
+    seed = module.MASTER_SEED if seed == SCRIPT_SEED else seed
+    script = ScriptFingerprints(module)
+    fingerprints = {i: None if seed is None else script.fingerprint(i, seed) for i in files}
+    if force:
+        stale = files
+    else:
+        stale = stale_files(suite, files, root, manifest, fingerprints, jobs)
+        print(f"🔁 {suite.name}: {len(files) - len(stale)} of {len(files)} files up to date")
+    files = stale
+    if not files:
+        print(f"✅ {suite.name}: nothing to rebuild\n")
+        return
+    jobs = max(1, min(jobs, len(files)))
+    print(f"🚀 {suite.name}: {len(files)} files -> {root} ({jobs} jobs)")
+    log_event(log, "suite_start", suite=suite.name, files=files, jobs=jobs, seed=seed, root=root)
+    for i in files:  # About to change: must not serve as link targets
+        manifest.pop(suite.input_name.format(i=i), None)
+        manifest.pop(suite.output_name.format(i=i), None)
+    by_hash = {entry["sha256"]: rel for rel, entry in sorted(manifest.items(), reverse=True)}
+    total_bytes = 0
+    linked_bytes = 0
+    for i, seconds, written, record in run_files(suite, files, jobs, root, seed, instrument):
+        size = 0
+        for rel, (sha, nbytes) in written.items():
+            size += nbytes
+            original = by_hash.get(sha)
+            if original is not None and original != rel and link_duplicate(root, rel, original):
+                linked_bytes += nbytes
+            else:
+                by_hash[sha] = rel
+            manifest[rel] = {"sha256": sha, "bytes": nbytes, "fingerprint": fingerprints[i]}
+        save_manifest(root, suite, manifest)  # A resumed run skips everything finished so far
+        total_bytes += size
+        print(f"  > File {i:02d}: {size / MB:.2f} MB in {seconds:.1f}s")
+        if record is not None:
+            print(f"    {format_record(record)}")
+            if record["profile"]:
+                print(f"    🔬 cProfile stats: {record['profile']} (python -m pstats)")
+            log_event(log, "file", **record)
+    os.makedirs(root, exist_ok=True)
+    save_manifest(root, suite, manifest)
+
+    elapsed = time.perf_counter() - start
+    duplicates = sum("duplicate_of" in entry for entry in manifest.values())
+    print(f"✅ {suite.name}: {total_bytes / MB:.2f} MB in {elapsed:.1f}s; "
+          f"{duplicates} duplicate files, {linked_bytes / MB:.2f} MB hard-linked\n")
+    log_event(log, "suite_done", suite=suite.name, files=len(files), bytes=total_bytes,
+              seconds=elapsed, linked_bytes=linked_bytes)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("suites", nargs="+", choices=sorted(SUITES))
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument("--files", help="file indices to (re)generate, e.g. 95-99 or 0-9,50 "
+                                        "(default: all)")
+    parser.add_argument("--out", help="write each suite under OUT/<suite> instead of "
+                                      "next to its script")
+    parser.add_argument("--seed", type=parse_seed, default=SCRIPT_SEED,
+                        help="master seed for every file (default: the script's MASTER_SEED; "
+                             "'none' for fresh entropy)")
+    parser.add_argument("--force", action="store_true",
+                        help="regenerate every selected file, even if its fingerprint is unchanged")
+    parser.add_argument("--log", help="instrument the run and append JSON lines to this file")
+    parser.add_argument("--tracemalloc", action="store_true",
+                        help="with --log: also trace Python allocations (slower)")
+    parser.add_argument("--profile", help="with --log: run these file indices under cProfile")
+    parser.add_argument("--profile-dir", default=".", help="where .prof files go (default: .)")
+    args = parser.parse_args(argv)
+    if (args.tracemalloc or args.profile) and not args.log:
+        parser.error("--tracemalloc and --profile need --log")
+
+    log = open(args.log, 'a') if args.log else None
+    try:
+        for name in args.suites:
+            suite = get_suite(name)
+            num_files = generator_for(suite).NUM_FILES
+            files = parse_files(args.files, num_files)
+            instrument = None
+            if log is not None:
+                profile = frozenset(parse_indices(args.profile)) if args.profile else frozenset()
+                instrument = Instrumentation(args.tracemalloc, profile, args.profile_dir)
+            run_suite(suite, files, args.jobs, args.out, args.seed, args.force, instrument, log)
+    finally:
+        if log is not None:
+            log.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+"""
+Opt-in instrumentation for generator runs (tools/generate.py --log,
+tools/bench.py).
+
+The scripts are left untouched. Their seeding, case builders and solvers
+are looked up by name in HOOKS and wrapped in timers when the module is
+instrumented. Then one file's wall time splits into:
+
+    construct  seeding and building the cases
+    solve      answering them
+    write      hashing and writing input / output (the f_in / f_out calls)
+    serialize  everything else in generate_file: formatting text or bytes
+
+FileProbe also records bytes written and peak memory (tracemalloc if asked
+for, which slows allocation-heavy scripts; and the process RSS high-water
+mark). It can run a file under cProfile and dump the stats.
+"""
+import cProfile
+import functools
+import os
+import time
+import tracemalloc
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+try:
+    import resource
+except ImportError:  # Not on Windows; RSS is then not reported
+    resource = None
+
+PHASES = ("construct", "solve", "serialize", "write")
+
+
+@dataclass
+class Hooks:
+    construct: tuple        # Module functions that seed and build the cases
+    solve: tuple            # Module functions that answer them
+    counted: bool = True    # Input starts with T; otherwise a file is one case
+    extra: object = None    # extra(module, clock) wraps builders not reachable by name
+
+
+def _wrap_killer_patterns(module, clock):
+    # ahshit looks its NumPy builders up in a dict, not by global name
+    module.KILLER_PATTERNS = {i: (clock.wrap("construct", build), closed_form)
+                              for i, (build, closed_form) in module.KILLER_PATTERNS.items()}
+    module.pattern_mixed = clock.wrap("construct", module.pattern_mixed)  # killer_pattern's fallback
+
+
+def _wrap_streamed_rows(module, clock):
+    # With STREAM_ROWS, files 10-19 draw their rows and solve them inside
+    # generate_file's write loop, not in build_cases / solve_diagonals.
+    # Subclasses, so the shared DiagonalStream class stays untouched.
+    class RandomRows(module.RandomRows):
+        __iter__ = clock.wrap_iter("construct", module.RandomRows.__iter__)
+
+    class DiagonalStream(module.DiagonalStream):
+        add_row = clock.wrap("solve", module.DiagonalStream.add_row)
+        answer = clock.wrap("solve", module.DiagonalStream.answer)
+
+    module.RandomRows = RandomRows
+    module.DiagonalStream = DiagonalStream
+
+
+HOOKS = {
+    "krish": Hooks(("seed_file", "build_cases"), ("solve_fast",)),
+    "atharv": Hooks(("seed_file", "build_cases"), ("solve_fast",)),
+    "aryan": Hooks(("seed_file", "build_cases"), ("solve_diagonals",), extra=_wrap_streamed_rows),
+    "ahshit": Hooks(("seed_file", "build_grid"), ("solve_diagonals",), extra=_wrap_killer_patterns),
+    "lavanya": Hooks(("seed_file", "build_cases"), ("solve_fast", "solve_batch")),
+    "romanch": Hooks(("seed_file", "build_cases"), ("solve", "solve_pairs")),
+    "romanch_killer": Hooks(("build_cases",), ("solve_pairs",)),
+    "romanch_tle": Hooks(("seed_file", "build_cases"), ("solve", "solve_pairs")),
+    "ranjan": Hooks(("seed_file", "build_values"), ("answer_lines",)),
+    "shreya": Hooks(("seed_file", "build_n"), ("solve",), counted=False),
+}
+
+
+class PhaseClock:
+    """
+    Accumulates seconds per phase across wrapped calls. A timed call made
+    inside another (a builder calling a solver) is charged to its own phase
+    only.
+    """
+
+    def __init__(self):
+        self.seconds = defaultdict(float)
+        self._nested = []
+
+    def wrap(self, phase, func):
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            self._nested.append(0.0)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                self.seconds[phase] += elapsed - self._nested.pop()
+                if self._nested:
+                    self._nested[-1] += elapsed
+        return timed
+
+    def wrap_iter(self, phase, func):
+        """Like wrap, for a generator function: each step of the iteration is timed."""
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            step = self.wrap(phase, functools.partial(next, iter(func(*args, **kwargs))))
+            while True:
+                try:
+                    item = step()
+                except StopIteration:
+                    return
+                yield item
+        return timed
+
+    def install(self, module, hooks):
+        for phase, names in (("construct", hooks.construct), ("solve", hooks.solve)):
+            for name in names:
+                setattr(module, name, self.wrap(phase, getattr(module, name)))
+        if hooks.extra is not None:
+            hooks.extra(module, self)
+
+
+class TimedWriter:
+    """Charges the time of every write() to the clock's "write" phase and counts bytes."""
+
+    def __init__(self, f, clock):
+        self.f = f
+        self.clock = clock
+        self.bytes = 0
+
+    def write(self, data):
+        start = time.perf_counter()
+        try:
+            self.bytes += len(data.encode("utf-8") if isinstance(data, str) else data)
+            return self.f.write(data)
+        finally:
+            self.clock.seconds["write"] += time.perf_counter() - start
+
+
+@dataclass
+class Instrumentation:
+    """What generate.py's workers record; must stay picklable."""
+    tracemalloc: bool = False
+    profile: frozenset = field(default_factory=frozenset)  # File indices run under cProfile
+    profile_dir: str = "."
+
+
+_clocks = {}
+
+
+def clock_for(name, module):
+    """The PhaseClock of suite `name`, installed into its module once per process."""
+    if name not in _clocks:
+        clock = PhaseClock()
+        clock.install(module, HOOKS[name])
+        _clocks[name] = clock
+    return _clocks[name]
+
+
+def peak_rss_bytes():
+    """High-water mark of this process's resident memory, or None."""
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024  # Linux reports KB
+
+
+class FileProbe:
+    """
+    Instruments the generation of one file:
+
+        with FileProbe("krish", module, 98, options) as probe:
+            output_text = module.generate_file(98, probe.writer(f_in))
+            probe.writer(f_out).write(output_text)
+        record = probe.record()
+    """
+
+    def __init__(self, name, module, i, options):
+        self.name = name
+        self.i = i
+        self.options = options
+        self.clock = clock_for(name, module)
+        self.writers = []
+        self.profiler = cProfile.Profile() if i in options.profile else None
+        self.profile_path = None
+
+    def writer(self, f):
+        timed = TimedWriter(f, self.clock)
+        self.writers.append(timed)
+        return timed
+
+    def __enter__(self):
+        self.clock.seconds.clear()
+        if self.options.tracemalloc:
+            tracemalloc.start()
+        self.start = time.perf_counter()
+        if self.profiler is not None:
+            self.profiler.enable()
+        return self
+
+    def __exit__(self, *exc_info):
+        if self.profiler is not None:
+            self.profiler.disable()
+            os.makedirs(self.options.profile_dir, exist_ok=True)
+            self.profile_path = os.path.join(self.options.profile_dir,
+                                             f"{self.name}_file{self.i:02d}.prof")
+            self.profiler.dump_stats(self.profile_path)
+        self.seconds = time.perf_counter() - self.start
+        self.tracemalloc_peak = None
+        if self.options.tracemalloc:
+            self.tracemalloc_peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        return False
+
+    def record(self):
+        """Structured log entry of the file."""
+        phases = {phase: self.clock.seconds[phase] for phase in PHASES if phase != "serialize"}
+        phases["serialize"] = max(0.0, self.seconds - sum(phases.values()))
+        return {
+            "suite": self.name,
+            "file": self.i,
+            "seconds": self.seconds,
+            "phases": {phase: round(phases[phase], 6) for phase in PHASES},
+            "bytes": sum(w.bytes for w in self.writers),
+            "tracemalloc_peak_bytes": self.tracemalloc_peak,
+            "rss_peak_bytes": peak_rss_bytes(),
+            "pid": os.getpid(),
+            "profile": self.profile_path,
+        }
+
+
+def format_record(record):
+    """One-line summary of a record for the progress output."""
+    phases = ", ".join(f"{phase} {record['phases'][phase]:.1f}s" for phase in PHASES)
+    memory = []
+    if record["tracemalloc_peak_bytes"] is not None:
+        memory.append(f"traced peak {record['tracemalloc_peak_bytes'] / 2**20:.0f} MB")
+    if record["rss_peak_bytes"] is not None:
+        memory.append(f"RSS peak {record['rss_peak_bytes'] / 2**20:.0f} MB")
+    return f"{phases}" + (f"; {', '.join(memory)}" if memory else "")
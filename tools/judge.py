@@ -0,0 +1,275 @@
+"""
+Local judge: runs a solution against every input file of a suite under
+time and memory limits, like the online judge would.
+
+The command (a compiled binary or e.g. `python3 sol.py`) reads inputNN.txt
+on stdin. Each run gets a CPU limit from --time-limit and an address-space
+limit from --memory-limit (ulimit -t / -v), and it is killed past the
+wall-clock limit. Per file the
+judge records wall time, CPU time (user + sys), peak RSS and a verdict
+against outputNN.txt:
+
+    AC   output matches          WA   output differs
+    TLE  CPU or wall time over   MLE  peak RSS over, or failed allocating
+    RE   non-zero exit or killed by a signal
+
+Outputs are compared token by token (ignoring case for the romanch suites,
+which accept YES/NO in any case), except for ranjan, whose answers are
+checked with its script's check() like custom_checker.cpp does. Files run in
+parallel: CPU time and peak RSS are per process, but wall time is not, so
+use --jobs 1 for wall-clock numbers. Linux counts the memory a process had
+before exec in its peak RSS, so small peaks read as the judge worker's own
+size (~20 MB); anything above that is exact.
+
+    python -m tools.judge romanch_tle "./brute" --time-limit 2
+    python -m tools.judge lavanya "python3 sol.py" --files 10-19 --jobs 4
+    python -m tools.judge ranjan ./sol --in ranjan/input --expected ranjan/output
+
+The table is printed and the results are saved as JSON (default
+judge_runs/<UTC time>.json at the repo root). Exit status 1 unless every
+file is AC.
+"""
+import argparse
+import json
+import math
+import os
+import shlex
+import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import partial
+
+from tools.generate import MB, generator_for, output_root, parse_indices
+from tools.resolve import input_files, tokenize_ints
+from tools.suites import REPO_ROOT, SUITES, get_suite
+
+VERDICTS = ("AC", "WA", "TLE", "MLE", "RE")
+MLE_MARGIN = 0.9  # A failed run that peaked above this share of the memory limit counts as MLE
+# Under the address-space limit an allocation fails before RSS grows: a failed run whose
+# stderr ends with one of these counts as MLE too
+MEMORY_ERRORS = ("MemoryError", "bad_alloc")
+
+
+# ==========================================
+# CHECKERS
+# ==========================================
+# checker(module, input_path, expected_path, output_path) -> None if the output
+# is accepted, else a short reason.
+
+def check_tokens(module, input_path, expected_path, output_path, fold_case=False):
+    """Whitespace-insensitive token comparison; case-insensitive too with fold_case."""
+    with open(expected_path, 'rb') as f:
+        expected = f.read().split()
+    with open(output_path, 'rb') as f:
+        got = f.read().split()
+    if fold_case:
+        expected = [token.upper() for token in expected]
+        got = [token.upper() for token in got]
+    for k, (want, have) in enumerate(zip(expected, got)):
+        if want != have:
+            return f"token {k + 1}: expected {want[:40].decode()!r}, got {have[:40].decode(errors='replace')!r}"
+    if len(expected) != len(got):
+        return f"{len(got)} tokens, expected {len(expected)}"
+    return None
+
+
+def check_ranjan(module, input_path, expected_path, output_path):
+    """Any "a b" per c that passes the script's check() (any valid pair is accepted)."""
+    with open(input_path, 'rb') as f:
+        tokens = tokenize_ints(f.read())
+    c_values = tokens[1:1 + int(tokens[0])].tolist()
+    try:
+        with open(output_path, 'rb') as f:
+            answers = tokenize_ints(f.read()).tolist()
+    except ValueError:
+        return "output is not all integers"
+    if len(answers) != 2 * len(c_values):
+        return f"{len(answers)} numbers, expected {2 * len(c_values)}"
+    for k, c in enumerate(c_values):
+        if not module.check(c, answers[2 * k], answers[2 * k + 1]):
+            return f"case {k + 1}: {answers[2 * k]} {answers[2 * k + 1]} fails for c = {c}"
+    return None
+
+
+check_tokens_nocase = partial(check_tokens, fold_case=True)
+
+CHECKERS = {
+    "ranjan": check_ranjan,
+    "romanch": check_tokens_nocase,
+    "romanch_killer": check_tokens_nocase,
+    "romanch_tle": check_tokens_nocase,
+}
+SCRIPT_CHECKERS = ("ranjan",)  # Checkers that need the suite's script as `module`
+
+
+# ==========================================
+# RUNNING ONE FILE
+# ==========================================
+
+def limited(argv, time_limit, memory_limit):
+    """
+    argv wrapped in `sh -c 'ulimit ... && exec "$@"'`: the CPU limit is a
+    second past time_limit (killed there), address space is capped at
+    memory_limit bytes. A preexec_fn would do the same, but is unsafe in a
+    worker that has timer threads.
+    """
+    limits = [f"ulimit -t {math.ceil(time_limit) + 1}"]
+    if memory_limit:
+        limits.append(f"ulimit -v {memory_limit // 1024}")
+    return ["sh", "-c", " && ".join(limits + ['exec "$@"']), "sh", *argv]
+
+
+def verdict_of(returncode, timed_out, cpu, peak_rss, time_limit, memory_limit):
+    if timed_out or cpu > time_limit:
+        return "TLE"
+    if memory_limit and peak_rss > memory_limit:
+        return "MLE"
+    if returncode != 0:
+        near_limit = memory_limit and peak_rss > MLE_MARGIN * memory_limit
+        return "MLE" if near_limit else "RE"
+    return None  # Ran within the limits: the checker decides
+
+
+def run_one(suite_name, argv, i, input_path, expected_path, time_limit, wall_limit, memory_limit):
+    """
+    Worker: runs the solution on one input file; returns its record. The
+    child is reaped with os.wait4 to get its own CPU time and peak RSS.
+    """
+    with tempfile.TemporaryDirectory(prefix="judge-") as scratch:
+        output_path = os.path.join(scratch, "stdout")
+        error_path = os.path.join(scratch, "stderr")
+        with open(input_path, 'rb') as f_in, open(output_path, 'wb') as f_out, \
+                open(error_path, 'wb') as f_err:
+            start = time.perf_counter()
+            proc = subprocess.Popen(limited(argv, time_limit, memory_limit),
+                                    stdin=f_in, stdout=f_out, stderr=f_err)
+            timed_out = threading.Event()
+
+            def kill():
+                timed_out.set()
+                proc.kill()
+            timer = threading.Timer(wall_limit, kill)
+            timer.start()
+            _, status, usage = os.wait4(proc.pid, 0)
+            proc.returncode = os.waitstatus_to_exitcode(status)  # Reaped here, not by Popen
+            timer.cancel()
+            wall = time.perf_counter() - start
+
+        cpu = usage.ru_utime + usage.ru_stime
+        peak_rss = usage.ru_maxrss * 1024  # Linux reports KB
+        verdict = verdict_of(proc.returncode, timed_out.is_set(), cpu, peak_rss,
+                             time_limit, memory_limit)
+        message = None
+        if verdict in ("RE", "MLE") and proc.returncode != 0:
+            with open(error_path, 'rb') as f:
+                lines = f.read().decode(errors="replace").strip().splitlines()
+            reason = f"signal {-proc.returncode}" if proc.returncode < 0 else f"exit {proc.returncode}"
+            message = reason + (f": {lines[-1][:80]}" if lines else "")
+            if lines and any(error in lines[-1] for error in MEMORY_ERRORS):
+                verdict = "MLE"
+        elif verdict is None:
+            checker = CHECKERS.get(suite_name, check_tokens)
+            module = generator_for(SUITES[suite_name]) if suite_name in SCRIPT_CHECKERS else None
+            message = checker(module, input_path, expected_path, output_path)
+            verdict = "WA" if message else "AC"
+
+    return {
+        "file": i,
+        "verdict": verdict,
+        "wall_seconds": round(wall, 4),
+        "cpu_seconds": round(cpu, 4),
+        "peak_rss_bytes": peak_rss,
+        "exit_code": proc.returncode,
+        "message": message,
+    }
+
+
+# ==========================================
+# DRIVER
+# ==========================================
+
+def report(records):
+    print(f"  {'file':<6}{'verdict':<9}{'wall':>8}{'cpu':>8}{'peak RSS':>11}  message")
+    for r in records:
+        print(f"  {format(r['file'], '02d'):<6}{r['verdict']:<9}{r['wall_seconds']:>7.2f}s{r['cpu_seconds']:>7.2f}s"
+              f"{r['peak_rss_bytes'] / MB:>8.1f} MB  {r['message'] or ''}")
+    counts = {v: sum(r["verdict"] == v for r in records) for v in VERDICTS}
+    summary = ", ".join(f"{counts[v]} {v}" for v in VERDICTS if counts[v])
+    worst = max(records, key=lambda r: r["cpu_seconds"])
+    print(f"{'✅' if counts['AC'] == len(records) else '❌'} {summary}; "
+          f"slowest file {worst['file']:02d} at {worst['cpu_seconds']:.2f}s CPU, "
+          f"peak RSS {max(r['peak_rss_bytes'] for r in records) / MB:.1f} MB\n")
+
+
+def default_json_path():
+    stamp = time.strftime("%Y%m%d-%H%M%S", time.gmtime())
+    return os.path.join(REPO_ROOT, "judge_runs", f"{stamp}.json")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("suite", choices=sorted(SUITES))
+    parser.add_argument("command", help="solution to run, e.g. ./sol or \"python3 sol.py\"")
+    parser.add_argument("--time-limit", type=float, default=2.0, help="CPU seconds per file (default: 2)")
+    parser.add_argument("--wall-limit", type=float,
+                        help="wall seconds before a run is killed (default: 2x time limit + 1)")
+    parser.add_argument("--memory-limit", type=int, default=512,
+                        help="MB of address space per run, 0 for none (default: 512)")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(), help="files run at once")
+    parser.add_argument("--files", help="file indices to run, e.g. 95-99 or 0-9,50 (default: all present)")
+    parser.add_argument("--in", dest="in_dir", help="directory holding the input files "
+                                                    "(default: where tools.generate writes them)")
+    parser.add_argument("--expected", help="directory holding the expected outputs "
+                                           "(default: where tools.generate writes them)")
+    parser.add_argument("--json", help="where to save the results (default: judge_runs/<time>.json)")
+    args = parser.parse_args(argv)
+    if not hasattr(os, "wait4"):
+        raise SystemExit("tools.judge needs a Unix system (os.wait4, sh and ulimit)")
+
+    suite = get_suite(args.suite)
+    root = output_root(suite, None)
+    in_dir = args.in_dir or os.path.dirname(os.path.join(root, suite.input_name))
+    expected_dir = args.expected or os.path.dirname(os.path.join(root, suite.output_name))
+    if not os.path.isdir(in_dir):
+        raise SystemExit(f"No input directory {in_dir}; pass --in")
+    files = input_files(suite, in_dir, parse_indices(args.files) if args.files else None)
+    if not files:
+        raise SystemExit(f"No input files in {in_dir}")
+    out_name = os.path.basename(suite.output_name)
+    missing = [i for i in files if not os.path.exists(os.path.join(expected_dir, out_name.format(i=i)))]
+    if missing:
+        raise SystemExit(f"No expected output for files {missing} in {expected_dir}; pass --expected")
+
+    command = shlex.split(args.command)
+    wall_limit = args.wall_limit or 2 * args.time_limit + 1
+    memory_limit = args.memory_limit * MB
+    jobs = max(1, min(args.jobs, len(files)))
+    print(f"⚖️  Judging {args.command!r} on {suite.name}: {len(files)} files, "
+          f"{args.time_limit:g}s CPU / {args.memory_limit or 'unlimited'} MB ({jobs} jobs)")
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(run_one, suite.name, command, i, path,
+                               os.path.join(expected_dir, out_name.format(i=i)),
+                               args.time_limit, wall_limit, memory_limit)
+                   for i, path in files.items()]
+        records = sorted((future.result() for future in as_completed(futures)),
+                         key=lambda r: r["file"])
+    report(records)
+
+    path = args.json or default_json_path()
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump({"time": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                   "suite": suite.name, "command": args.command,
+                   "limits": {"time_seconds": args.time_limit, "wall_seconds": wall_limit,
+                              "memory_mb": args.memory_limit},
+                   "input_dir": in_dir, "expected_dir": expected_dir,
+                   "files": records}, f, indent=1)
+    print(f"💾 Results saved to {path}")
+    raise SystemExit(0 if all(r["verdict"] == "AC" for r in records) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,294 @@
+"""
+Worst-case input search for the killer suites.
+
+Instead of hand-building adversarial files, an evolutionary loop mutates
+candidate inputs (always within the problem's constraints) and keeps the
+ones a known slow solution spends the most on. The cost is either an
+operation count of a Python model of that solution, or the wall time of a
+locally compiled binary fed the rendered input on stdin (--binary).
+
+    python -m tools.search romanch_killer --generations 200 --emit 2
+    python -m tools.search ahshit --binary ./brute --n 200 --population 4
+
+--emit K writes the K best finds as extra test files of the suite, numbered
+from its NUM_FILES on (or --start), with outputs from the suite's solver.
+Unlike the generators, this tool needs NumPy.
+"""
+import argparse
+import os
+import pickle
+import subprocess
+import time
+from dataclasses import dataclass
+
+import numpy as np
+
+from tools.generate import output_root
+from tools.suites import get_suite, load_generator
+
+
+@dataclass
+class Target:
+    suite: str         # Suite the finds are emitted into
+    default_n: int     # Size searched at unless --n is given
+    make_case: object  # make_case(rng, n) -> case
+    mutate: object     # mutate(rng, case) -> new case, within constraints
+    cost: object       # cost(case) -> operation count of the slow solution
+    render: object     # render(rng, case) -> input text with T = 1
+    answer: object     # answer(solver, case) -> output text
+
+
+# ==========================================
+# ROMANCH: remove-one-element brute force
+# ==========================================
+
+PAIR_MAX_VAL = 1_000_000_000
+
+
+def pairs_case(rng, n):
+    d = int(rng.integers(0, 10_000, endpoint=True))
+    return d, np.sort(rng.integers(1, PAIR_MAX_VAL, size=n, endpoint=True))
+
+
+def pairs_mutate(rng, case):
+    """One random edit of a window: rerandomise it, make its pairs fit, or change d."""
+    d, a = case
+    a = a.copy()
+    n = len(a)
+    lo = int(rng.integers(0, n))
+    hi = min(n, lo + int(rng.integers(1, max(2, n // 4))))
+    kind = rng.integers(4)
+    if kind == 0:
+        a[lo:hi] = rng.integers(1, PAIR_MAX_VAL, size=hi - lo, endpoint=True)
+    elif kind == 1:
+        # Tight pairs: every second value lands within d of its left neighbour
+        start = lo - lo % 2
+        pairs = len(a[start + 1:hi:2])
+        tight = a[start:start + 2 * pairs:2] + rng.integers(0, d + 1, size=pairs)
+        a[start + 1:hi:2] = np.minimum(tight, PAIR_MAX_VAL)
+    elif kind == 2:
+        # A single value far from everything else
+        a[lo] = rng.integers(1, PAIR_MAX_VAL, endpoint=True)
+    else:
+        d = int(min(PAIR_MAX_VAL, max(0, round(d * rng.uniform(0.5, 2.0)) + rng.integers(-5, 6))))
+    return d, np.sort(a)
+
+
+def pairs_cost(case):
+    """
+    Operation count of the O(n^2) solution killer.py was written against:
+    for every index k in order, copy the other n-1 values and check their
+    neighbour pairs until one is wider than d; stop at the first k that
+    works. Even n is one pass without removal. Every k is evaluated at once
+    from prefix / next-failure tables over the sorted array.
+    """
+    d, a = case
+    n = len(a)
+    fits = np.diff(a) <= d
+    if n % 2 == 0:
+        bad = np.flatnonzero(~fits[0::2])
+        return n + (int(bad[0]) + 1 if len(bad) else n // 2)
+
+    left, right = fits[0::2], fits[1::2] # (2j, 2j+1) and (2j+1, 2j+2)
+    h = len(left)
+    bad_left = np.flatnonzero(~left)
+    first_bad_left = int(bad_left[0]) if len(bad_left) else h
+    next_bad_right = np.append(
+        np.minimum.accumulate(np.where(right, h, np.arange(h))[::-1])[::-1], h)
+
+    k = np.arange(n)
+    m = k // 2
+    odd = k % 2 == 1
+    # Removing k: left pairs L[:m], for odd k the bridge (k-1, k+1), then
+    # right pairs from R[m] (even k) or R[m+1] (odd k).
+    left_fail = first_bad_left < m
+    checks = np.where(left_fail, first_bad_left + 1, m)
+    ok = ~left_fail
+    bridge = np.ones(n, dtype=bool)
+    bridge[1:-1:2] = a[2::2] - a[:-2:2] <= d
+    checks += ok & odd
+    ok &= bridge
+    start = np.where(odd, m + 1, m)
+    stop_at = next_bad_right[start]
+    right_fail = stop_at < h
+    checks += np.where(ok, np.where(right_fail, stop_at - start + 1, h - start), 0)
+    ok &= ~right_fail
+
+    works = np.flatnonzero(ok)
+    attempts = int(works[0]) + 1 if len(works) else n
+    return attempts * (n - 1) + int(checks[:attempts].sum())
+
+
+def pairs_render(rng, case):
+    d, a = case
+    shuffled = rng.permutation(a)
+    return f"1\n{len(a)} {d}\n" + " ".join(map(str, shuffled.tolist())) + "\n"
+
+
+# ==========================================
+# AHSHIT: diagonal walk
+# ==========================================
+
+GRID_MAX_VAL = 1_000_000_000
+
+
+def grid_case(rng, n):
+    return rng.integers(-GRID_MAX_VAL, GRID_MAX_VAL, size=(n, n), endpoint=True)
+
+
+def grid_mutate(rng, grid):
+    """One random edit of a square block: rerandomise, negate, or checkerboard its signs."""
+    grid = grid.copy()
+    n = len(grid)
+    r, c = rng.integers(0, n, size=2)
+    size = int(rng.integers(1, max(2, n // 4)))
+    block = grid[r:r + size, c:c + size]
+    kind = rng.integers(3)
+    if kind == 0:
+        block[...] = rng.integers(-GRID_MAX_VAL, GRID_MAX_VAL, size=block.shape, endpoint=True)
+    elif kind == 1:
+        block *= -1
+    else:
+        rows, cols = np.indices(block.shape)
+        block[...] = np.where((rows + cols) % 2 == 0, abs(block), -abs(block))
+    return grid
+
+
+def grid_cost(grid):
+    """
+    Branch cost of solve_python_logic's walk (its length is fixed at n^2):
+    how often the outcome of `val < minn` differs from the previous step
+    on the same diagonal, i.e. what a last-outcome predictor gets wrong.
+    """
+    n = len(grid)
+    flips = 0
+    for k in range(-(n - 1), n):
+        vals = np.diagonal(grid, k)
+        if len(vals) > 2:
+            taken = vals[1:] < np.minimum.accumulate(vals)[:-1]
+            flips += int(np.count_nonzero(taken[1:] != taken[:-1]))
+    return flips
+
+
+def grid_render(rng, grid):
+    rows = "\n".join(" ".join(map(str, row)) for row in grid.tolist())
+    return f"1\n{len(grid)}\n{rows}\n"
+
+
+TARGETS = {
+    "romanch_killer": Target("romanch_killer", 99_999, pairs_case, pairs_mutate, pairs_cost,
+                             pairs_render, lambda solve, c: f"{solve(len(c[1]), c[0], c[1])}\n"),
+    "ahshit": Target("ahshit", 500, grid_case, grid_mutate, grid_cost,
+                     grid_render, lambda solve, g: f"{solve(g)}\n"),
+}
+
+
+# ==========================================
+# SEARCH
+# ==========================================
+
+def binary_cost(binary, render, repeat, timeout, rng):
+    """Cost function timing `binary` on the rendered case (best of `repeat`)."""
+    def cost(case):
+        data = render(rng, case).encode()
+        best = timeout
+        for _ in range(repeat):
+            start = time.perf_counter()
+            try:
+                subprocess.run([binary], input=data, stdout=subprocess.DEVNULL,
+                               timeout=timeout, check=False)
+            except subprocess.TimeoutExpired:
+                return timeout
+            best = min(best, time.perf_counter() - start)
+        return best
+    return cost
+
+
+def format_cost(cost):
+    return f"{cost:,}" if isinstance(cost, int) else f"{cost:.4f}s"
+
+
+def search(target, n, measure, population, generations, rng):
+    """
+    (mu + lambda) evolution: every generation each survivor gets one mutated
+    child, and the best `population` of parents and children survive.
+    With population=1 this is plain hill climbing. Returns [(cost, case)]
+    best first.
+    """
+    pool = [target.make_case(rng, n) for _ in range(population)]
+    scored = sorted(((measure(c), c) for c in pool), key=lambda s: s[0], reverse=True)
+    print(f"  generation 0: best cost {format_cost(scored[0][0])}")
+    for g in range(1, generations + 1):
+        children = [target.mutate(rng, case) for _, case in scored]
+        scored += [(measure(c), c) for c in children]
+        scored = sorted(scored, key=lambda s: s[0], reverse=True)[:population]
+        if g % 10 == 0 or g == generations:
+            print(f"  generation {g}: best cost {format_cost(scored[0][0])}")
+    return scored
+
+
+def distinct(finds, count):
+    """The first `count` finds with different inputs (survivors often repeat)."""
+    seen, picked = set(), []
+    for cost, case in finds:
+        key = pickle.dumps(case)
+        if key not in seen:
+            seen.add(key)
+            picked.append((cost, case))
+    return picked[:count]
+
+
+def emit(target, finds, start, out, rng):
+    suite = get_suite(target.suite)
+    module = load_generator(suite)
+    solver = getattr(module, suite.solver)
+    root = output_root(suite, out)
+    for offset, (cost, case) in enumerate(finds):
+        i = start + offset
+        input_path = os.path.join(root, suite.input_name.format(i=i))
+        output_path = os.path.join(root, suite.output_name.format(i=i))
+        os.makedirs(os.path.dirname(input_path), exist_ok=True)
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        with open(input_path, 'w') as f_in:
+            f_in.write(target.render(rng, case))
+        with open(output_path, 'w') as f_out:
+            f_out.write(target.answer(solver, case))
+        print(f"  > {input_path} (cost {format_cost(cost)})")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("target", choices=sorted(TARGETS))
+    parser.add_argument("--n", type=int, help="case size to search at (default: the max)")
+    parser.add_argument("--population", type=int, default=8)
+    parser.add_argument("--generations", type=int, default=100)
+    parser.add_argument("--binary", help="time this executable instead of the Python cost model")
+    parser.add_argument("--repeat", type=int, default=3, help="timing runs per candidate")
+    parser.add_argument("--timeout", type=float, default=10.0, help="seconds; a timeout is max cost")
+    parser.add_argument("--emit", type=int, default=0, help="write the K best finds as test files")
+    parser.add_argument("--start", type=int, help="first file index to emit (default: NUM_FILES)")
+    parser.add_argument("--out", help="emit under OUT/<suite> instead of next to the script")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args(argv)
+
+    target = TARGETS[args.target]
+    rng = np.random.default_rng(args.seed)
+    if args.binary:
+        measure = binary_cost(os.path.abspath(args.binary), target.render, args.repeat, args.timeout, rng)
+    else:
+        measure = target.cost
+
+    n = args.n or target.default_n
+    print(f"🔎 {args.target}: searching n={n}, population {args.population}, "
+          f"{args.generations} generations")
+    finds = search(target, n, measure, args.population, args.generations, rng)
+
+    if args.emit:
+        start = args.start
+        if start is None:
+            start = load_generator(get_suite(target.suite)).NUM_FILES
+        emit(target, distinct(finds, args.emit), start, args.out, rng)
+
+
+if __name__ == "__main__":
+    main()
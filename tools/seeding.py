@@ -0,0 +1,38 @@
+"""
+Per-file seeding shared by the generator scripts.
+
+File i of a problem draws only from streams derived from
+(problem, master seed, i), so its bytes do not depend on which files were
+generated before it, in which order, or in which process: regenerating
+krish file 98 alone gives the bytes it has inside a full run, and a parallel
+run matches a serial one. Editing one strategy branch only changes the
+files that branch builds.
+
+Scripts call seed_file() at the top of their generate_file(i, f_in) hook:
+
+    rng = seed_file("krish", MASTER_SEED, i)
+
+which seeds the global `random` module and returns a NumPy Generator on the
+same seed (None without NumPy). A master seed of None keeps the old
+behaviour: fresh OS entropy for every file.
+"""
+import hashlib
+import random
+
+try:
+    import numpy as np
+except ImportError:  # Scripts without NumPy only use the `random` module
+    np = None
+
+
+def file_seed(problem, master_seed, i):
+    """64-bit seed of file i; a hash, so nearby (problem, seed, i) are unrelated."""
+    digest = hashlib.sha256(f"{problem}/{master_seed}/{i}".encode()).digest()
+    return int.from_bytes(digest[:8], "little")
+
+
+def seed_file(problem, master_seed, i):
+    """Seeds `random` for file i and returns a matching NumPy Generator (or None)."""
+    seed = None if master_seed is None else file_seed(problem, master_seed, i)
+    random.seed(seed)
+    return np.random.default_rng(seed) if np is not None else None
@@ -0,0 +1,215 @@
+"""
+Registry of the generator scripts: where each lives, which solver its
+outputs come from, where it writes, and how its files are grouped.
+
+A suite's strategies mirror the per-file-index if/elif chain of its script.
+`knobs` names the module-level size settings a strategy depends on; a
+strategy with no knobs always produces the same amount of data.
+`linear=True` marks strategies whose size is exactly proportional to their
+knobs (a case count), so they can be sampled at a reduced count.
+
+Every script exposes the same per-file hook, generate_file(i, f_in), which
+writes input file i to f_in and returns the output text; `binary=True`
+marks scripts whose hook writes bytes. Scripts import the shared helpers
+(tools.seeding, tools.cases) as a top-level package: load_script puts the
+repo root on sys.path. To run a script's own main() instead of
+`python -m tools.generate`, set PYTHONPATH to the repo root.
+"""
+import importlib.util
+import os
+import sys
+from dataclasses import dataclass, field
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@dataclass
+class Strategy:
+    name: str
+    files: range
+    knobs: tuple = ()
+    linear: bool = False
+
+
+@dataclass
+class Suite:
+    name: str
+    script: str                                # Path relative to REPO_ROOT
+    solver: str                                # Function generate_file answers with
+    out_dir: str                               # Output root, relative to the script's directory
+    strategies: list
+    caps: dict = field(default_factory=dict)   # knob -> module attr holding its hard limit
+    floors: dict = field(default_factory=dict) # knob -> smallest value it may be scaled to
+    input_name: str = "input/input{i:02d}.txt"
+    output_name: str = "output/output{i:02d}.txt"
+    binary: bool = False
+
+    @property
+    def knobs(self):
+        names = []
+        for strategy in self.strategies:
+            for knob in strategy.knobs:
+                if knob not in names:
+                    names.append(knob)
+        return names
+
+
+SUITES = {
+    "krish": Suite(
+        name="krish",
+        script="krish/testcases.py",
+        solver="solve_fast",
+        out_dir="test_cases",
+        strategies=[
+            Strategy("edge", range(0, 5)),
+            Strategy("random", range(5, 50), knobs=("TARGET_NM",)),
+            Strategy("scaled", range(50, 85), knobs=("TARGET_NM",)),
+            Strategy("stress", range(85, 95), knobs=("STRESS_TARGET_NM",)),
+            Strategy("max_n", range(95, 96)),
+            Strategy("max_m", range(96, 97)),
+            Strategy("square_700", range(97, 98)),
+            Strategy("max_valid", range(98, 99)),
+            Strategy("max_invalid", range(99, 100)),
+        ],
+        caps={"TARGET_NM": "MAX_NM_SUM", "STRESS_TARGET_NM": "MAX_NM_SUM"},
+    ),
+    "atharv": Suite(
+        name="atharv",
+        script="atharv/testcases.py",
+        solver="solve_fast",
+        out_dir="atharv_test_cases",
+        strategies=[
+            Strategy("edge", range(0, 10)),
+            Strategy("stress", range(10, 40), knobs=("SUM_S_PER_FILE",)),
+            Strategy("max", range(40, 100)),
+        ],
+        binary=True,
+    ),
+    "aryan": Suite(
+        name="aryan",
+        script="aryan/testcases.py",
+        solver="solve_diagonals",
+        out_dir="aryan_test_cases",
+        strategies=[
+            Strategy("edge", range(0, 10)),
+            # T=2 grids of n=500 are only added while they fit the budget.
+            Strategy("max", range(10, 20), knobs=("SUM_N_SQUARED_PER_FILE",)),
+            Strategy("random", range(20, 60), knobs=("SUM_N_SQUARED_PER_FILE",)),
+        ],
+        # Below one 500 x 500 grid the "max" files would be empty (T=0)
+        floors={"SUM_N_SQUARED_PER_FILE": 500 * 500},
+    ),
+    "ahshit": Suite(
+        name="ahshit",
+        script="aryan/one_more/ahshit.py",
+        solver="solve_diagonals",
+        out_dir="aryan_killer_tests",
+        strategies=[
+            Strategy("random", range(0, 1), knobs=("T_PER_FILE",), linear=True),
+            Strategy("all_negative", range(1, 2), knobs=("T_PER_FILE",), linear=True),
+            Strategy("diagonal", range(2, 3), knobs=("T_PER_FILE",), linear=True),
+            Strategy("alternating", range(3, 4), knobs=("T_PER_FILE",), linear=True),
+            Strategy("mixed", range(4, 5), knobs=("T_PER_FILE",), linear=True),
+        ],
+    ),
+    "lavanya": Suite(
+        name="lavanya",
+        script="lavanya/testcases.py",
+        solver="solve_fast",
+        out_dir="lavanya_test_cases",
+        strategies=[
+            Strategy("edge", range(0, 10)),
+            Strategy("max", range(10, 20)),
+            Strategy("random", range(20, 100), knobs=("SUM_N_PER_FILE",)),
+        ],
+    ),
+    "romanch": Suite(
+        name="romanch",
+        script="romanch/testcases.py",
+        solver="solve_pairs",
+        out_dir="romanch_test_cases",
+        strategies=[
+            Strategy("edge", range(0, 10)),
+            Strategy("max", range(10, 20)),
+            Strategy("random", range(20, 100), knobs=("SUM_N_PER_FILE",)),
+        ],
+    ),
+    "romanch_killer": Suite(
+        name="romanch_killer",
+        script="romanch/one_more/killer.py",
+        solver="solve_pairs",
+        out_dir="romanch_killer_cases",
+        strategies=[Strategy("trap", range(0, 5))],   # N must stay odd: not a knob
+    ),
+    "romanch_tle": Suite(
+        name="romanch_tle",
+        script="romanch/tle_cases/tlecases.py",
+        solver="solve_pairs",
+        out_dir="romanch_max_constraints",
+        strategies=[
+            Strategy("monolith_even", range(0, 1)),
+            Strategy("monolith_odd", range(1, 2)),
+            Strategy("split_even", range(2, 3)),
+            Strategy("split_odd", range(3, 4)),
+            Strategy("chaos", range(4, 5), knobs=("MAX_N_SUM",)),
+        ],
+    ),
+    "ranjan": Suite(
+        name="ranjan",
+        script="ranjan/testcase.py",
+        solver="solve",
+        out_dir="ranjan_nuclear_tests",
+        strategies=[
+            Strategy("edge", range(0, 5), knobs=("MAX_T",)),
+            Strategy("bitwise", range(5, 10), knobs=("MAX_T",)),
+            Strategy("chaos", range(10, 40), knobs=("MAX_T",)),
+            Strategy("wall", range(40, 100), knobs=("MAX_T",)),
+        ],
+        input_name="input{i:02d}.txt",
+        output_name="output{i:02d}.txt",
+    ),
+    "shreya": Suite(
+        name="shreya",
+        script="Shreya/testcases.py",
+        solver="solve",
+        out_dir="shreya_test_cases",
+        strategies=[
+            Strategy("edge", range(0, 10)),
+            Strategy("huge", range(10, 20)),
+            Strategy("random", range(20, 100)),
+        ],
+    ),
+}
+
+
+def load_script(script, module_name):
+    """
+    Imports a script (path relative to REPO_ROOT) as a module without
+    running its main(). Like `python script.py`, the script's own directory
+    goes on sys.path so sibling imports (e.g. aryan/diagonal_solver.py)
+    resolve; the repo root follows it, for `from tools.seeding import ...`.
+    """
+    path = os.path.join(REPO_ROOT, script)
+    script_dir = os.path.dirname(path)
+    for entry in (REPO_ROOT, script_dir):
+        if entry not in sys.path:
+            sys.path.insert(0, entry)
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_generator(suite):
+    return load_script(suite.script, f"{suite.name}_generator")
+
+
+def script_dir(suite):
+    return os.path.dirname(os.path.join(REPO_ROOT, suite.script))
+
+
+def get_suite(name):
+    try:
+        return SUITES[name]
+    except KeyError:
+        raise SystemExit(f"Unknown suite {name!r}. Choose from: {', '.join(SUITES)}")
@@ -0,0 +1,263 @@
+"""
+Constraint validators: checks that input files respect their problem
+statement, one validator per problem.
+
+Each input file is memory-mapped and tokenized in bulk (tools/resolve.py).
+The constraints are then checked with vectorized passes over the token
+array: case headers are walked once, and every body value is range-checked
+at once. Files are validated in parallel, one per task. The limits are
+the statement's, written out below rather than read from the generator
+settings, so a wrong setting is caught too.
+
+    python -m tools.validate                  # every suite, default layout
+    python -m tools.validate krish ahshit --jobs 8
+    python -m tools.validate ranjan --in ranjan/input
+
+Exits 1 if any file breaks a constraint; the first broken one is reported
+per file.
+"""
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import partial
+
+from tools.generate import MB, output_root, parse_indices
+from tools.resolve import input_files, np, read_mapped, tokenize_ints
+from tools.suites import SUITES, get_suite
+
+
+class InputError(ValueError):
+    """An input file breaks a constraint of its problem statement."""
+
+
+def require(ok, message):
+    if not ok:
+        raise InputError(message)
+
+
+def require_all(ok, message, case_of=None):
+    """ok is a boolean array; the first False is reported (with its 1-based case if case_of is given)."""
+    if ok.all():
+        return
+    where = int(np.argmin(ok))
+    prefix = f"case {int(case_of[where]) + 1}: " if case_of is not None else ""
+    raise InputError(prefix + message)
+
+
+def counted_layout(tokens, header, body):
+    """
+    Walks a T-prefixed layout: T, then per case `header` ints followed by
+    body(*header) values. Returns (headers as a T x header array, body
+    sizes, all body values in one array, case index of each value).
+    Fails if the tokens run out early or are left over.
+    """
+    require(len(tokens) >= 1, "file is empty")
+    t = int(tokens[0])
+    require(t >= 1, f"T = {t} must be at least 1")
+    heads, sizes = [], []
+    pos = 1
+    for k in range(t):
+        require(pos + header <= len(tokens), f"case {k + 1}: file ends inside the case")
+        head = tokens[pos:pos + header].tolist()
+        size = body(*head)
+        require(size >= 0, f"case {k + 1}: header {' '.join(map(str, head))} is out of range")
+        pos += header + size
+        require(pos <= len(tokens), f"case {k + 1}: file ends inside the case")
+        heads.append(head)
+        sizes.append(size)
+    require(pos == len(tokens), f"{len(tokens) - pos} tokens after the last of the {t} cases")
+
+    heads = np.array(heads, dtype=np.int64).reshape(t, header)
+    sizes = np.array(sizes, dtype=np.int64)
+    case_start = 1 + np.concatenate(([0], np.cumsum(sizes + header)[:-1]))
+    in_body = np.ones(len(tokens), dtype=bool)
+    in_body[0] = False
+    for j in range(header):
+        in_body[case_start + j] = False
+    case_of = np.repeat(np.arange(t), sizes)
+    return heads, sizes, tokens[in_body], case_of
+
+
+def require_between(values, low, high, what, case_of=None):
+    require_all((values >= low) & (values <= high), f"{what} outside [{low}, {high}]", case_of)
+
+
+# ==========================================
+# PER-PROBLEM VALIDATORS
+# ==========================================
+# Each takes the mapped input of one file and raises InputError at the first
+# broken constraint.
+
+def validate_krish(data, max_nm_sum=10**6):
+    """1 <= n, m; every matrix is a permutation of 0..n*m-1; sum of n*m <= 10^6."""
+    tokens = tokenize_ints(data)
+    heads, sizes, values, case_of = counted_layout(
+        tokens, 2, lambda n, m: n * m if n >= 1 and m >= 1 else -1)
+    total = int(sizes.sum())
+    require(total <= max_nm_sum, f"sum of n*m = {total} exceeds {max_nm_sum}")
+    require_all((values >= 0) & (values < sizes[case_of]), "value outside [0, n*m - 1]", case_of)
+    # Values of case k land in their own block of the counts: once each iff a permutation
+    block = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+    counts = np.bincount(block[case_of] + values, minlength=total)
+    require_all(counts == 1, "values are not distinct", case_of)
+
+
+def validate_atharv(data, max_len=10**5):
+    """One "s t" pair per line; printable ASCII, no whitespace; 1 <= |s| = |t| <= 10^5."""
+    raw = np.frombuffer(data, dtype=np.uint8)
+    allowed = ((raw >= ord("!")) & (raw <= ord("~"))) | (raw == ord(" ")) | (raw == ord("\n"))
+    del raw  # The mmap cannot close while a view of it is alive
+    require_all(allowed, "character that is not printable ASCII, a space or a newline")
+    lines = data[:].split(b"\n")
+    if lines[-1] == b"":
+        lines.pop()
+    require(lines and lines[0].isdigit(), "first line is not T")
+    count = int(lines[0])
+    require(count >= 1, f"T = {count} must be at least 1")
+    require(len(lines) == count + 1, f"{len(lines) - 1} case lines for T = {count}")
+    for k, line in enumerate(lines[1:]):
+        pair = line.split(b" ")
+        require(len(pair) == 2 and all(pair), f"case {k + 1}: not two strings separated by one space")
+        s, t = pair
+        require(len(s) == len(t), f"case {k + 1}: |s| = {len(s)} but |t| = {len(t)}")
+        require(len(s) <= max_len, f"case {k + 1}: |s| = {len(s)} exceeds {max_len}")
+
+
+def validate_aryan(data, max_n=500, max_abs=10**9, max_n2_sum=500_000):
+    """1 <= n <= 500; |a| <= 10^9; sum of n^2 <= SUM_N_SQUARED_PER_FILE = 5 * 10^5 (None: no budget)."""
+    tokens = tokenize_ints(data)
+    heads, sizes, values, case_of = counted_layout(
+        tokens, 1, lambda n: n * n if 1 <= n <= max_n else -1)
+    if max_n2_sum is not None:
+        total = int(sizes.sum())
+        require(total <= max_n2_sum, f"sum of n^2 = {total} exceeds {max_n2_sum}")
+    require_between(values, -max_abs, max_abs, "value", case_of)
+
+
+def validate_lavanya(data, max_n=10**5, max_val=10**6):
+    """1 <= d <= n <= 10^5; 1 <= expense <= 10^6."""
+    tokens = tokenize_ints(data)
+    heads, sizes, values, case_of = counted_layout(
+        tokens, 2, lambda n, d: n if 1 <= d <= n <= max_n else -1)
+    require_between(values, 1, max_val, "expense", case_of)
+
+
+def validate_romanch(data, max_t=10**4, max_n=10**5, max_n_sum=10**5, max_d=10**9, max_val=10**9):
+    """1 <= T <= 10^4; 1 <= n <= 10^5; sum of n <= 10^5; 0 <= d <= 10^9; 1 <= a <= 10^9."""
+    tokens = tokenize_ints(data)
+    require(len(tokens) >= 1, "file is empty")
+    require(int(tokens[0]) <= max_t, f"T = {int(tokens[0])} exceeds {max_t}")
+    heads, sizes, values, case_of = counted_layout(
+        tokens, 2, lambda n, d: n if 1 <= n <= max_n and 0 <= d <= max_d else -1)
+    total = int(sizes.sum())
+    require(total <= max_n_sum, f"sum of n = {total} exceeds {max_n_sum}")
+    require_between(values, 1, max_val, "a", case_of)
+
+
+def validate_ranjan(data, max_t=10**5, max_c=10**7):
+    """1 <= T <= 10^5, then T values 1 <= c <= 10^7."""
+    tokens = tokenize_ints(data)
+    require(len(tokens) >= 1, "file is empty")
+    t = int(tokens[0])
+    require(1 <= t <= max_t, f"T = {t} outside [1, {max_t}]")
+    require(len(tokens) == t + 1, f"{len(tokens) - 1} values for T = {t}")
+    require_between(tokens[1:], 1, max_c, "c")
+
+
+def validate_shreya(data, max_n=10**18):
+    """A single 1 <= n <= 10^18."""
+    tokens = tokenize_ints(data)
+    require(len(tokens) == 1, f"{len(tokens)} tokens instead of a single n")
+    require_between(tokens, 1, max_n, "n")
+
+
+VALIDATORS = {
+    "krish": validate_krish,
+    "atharv": validate_atharv,
+    "aryan": validate_aryan,
+    # The killer files are T = 40 grids of 500 x 500 on purpose: no per-file n^2 budget
+    "ahshit": partial(validate_aryan, max_n2_sum=None),
+    "lavanya": validate_lavanya,
+    "romanch": validate_romanch,
+    "romanch_killer": validate_romanch,
+    "romanch_tle": validate_romanch,
+    "ranjan": validate_ranjan,
+    "shreya": validate_shreya,
+}
+
+
+# ==========================================
+# DRIVER
+# ==========================================
+
+def validate_one(name, i, path):
+    """Worker: returns (i, seconds, bytes, error message or None)."""
+    start = time.perf_counter()
+    try:
+        read_mapped(path, lambda module, data: VALIDATORS[name](data), None)
+        error = None
+    except ValueError as e:  # InputError, or a token that is not an integer (tokenize_ints)
+        error = str(e)
+    return i, time.perf_counter() - start, os.path.getsize(path), error
+
+
+def run_suite(suite, jobs, in_dir, picked):
+    """Validates the suite's input files; returns the number of invalid ones."""
+    in_dir = in_dir or os.path.dirname(os.path.join(output_root(suite, None), suite.input_name))
+    if not os.path.isdir(in_dir):
+        print(f"⚠️  {suite.name}: no input directory {in_dir}\n")
+        return 0
+    files = input_files(suite, in_dir, picked)
+    if not files:
+        print(f"⚠️  {suite.name}: no input files in {in_dir}\n")
+        return 0
+    jobs = max(1, min(jobs, len(files)))
+    print(f"🔎 Validating {suite.name}: {len(files)} inputs in {in_dir} ({jobs} jobs)")
+
+    start = time.perf_counter()
+    if jobs == 1:
+        results = [validate_one(suite.name, i, path) for i, path in files.items()]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = [pool.submit(validate_one, suite.name, i, path) for i, path in files.items()]
+            results = [future.result() for future in as_completed(futures)]
+
+    invalid = 0
+    for i, seconds, nbytes, error in sorted(results):
+        if error is not None:
+            invalid += 1
+            print(f"  ❌ File {i:02d}: {error}")
+    total_bytes = sum(nbytes for _, _, nbytes, _ in results)
+    elapsed = time.perf_counter() - start
+    print(f"{'❌' if invalid else '✅'} {suite.name}: {len(files) - invalid} of {len(files)} files valid, "
+          f"{total_bytes / MB:.1f} MB in {elapsed:.1f}s\n")
+    return invalid
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("suites", nargs="*", metavar="suite",
+                        help=f"any of {', '.join(sorted(SUITES))} (default: all)")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument("--files", help="file indices to validate, e.g. 95-99 or 0-9,50 "
+                                        "(default: every input present)")
+    parser.add_argument("--in", dest="in_dir", help="directory holding the input files "
+                                                    "(default: where tools.generate writes them)")
+    args = parser.parse_args(argv)
+    for name in args.suites:
+        get_suite(name)
+    if args.in_dir and len(args.suites) != 1:
+        parser.error("--in takes a single suite")
+    if np is None:
+        raise SystemExit("tools.validate needs NumPy for its vectorized checks")
+
+    picked = parse_indices(args.files) if args.files else None
+    invalid = 0
+    for name in args.suites or list(SUITES):
+        invalid += run_suite(SUITES[name], args.jobs, args.in_dir, picked)
+    raise SystemExit(1 if invalid else 0)
+
+
+if __name__ == "__main__":
+    main()